@@ -1,17 +1,54 @@
+import ast
 import json
 import base64
+import codecs
+import concurrent.futures
+import contextlib
 import csv
 import hashlib
 import io
+import os
+import re
+import secrets
+import shutil
+import tempfile
+import threading
+import time
+import warnings
 import zipfile
+import zlib
 from functools import lru_cache
 from pathlib import Path
+from urllib.parse import quote, urlencode
 
 import dash
-from dash import dcc, html, Input, Output, State, ALL, callback_context, no_update
+import diskcache
+import flask
+from dash import dcc, html, Input, Output, State, ALL, ClientsideFunction, DiskcacheManager, Patch, callback_context, no_update
 import numpy as np
 import plotly.graph_objects as go
 
+try:
+    import numba
+except ImportError:
+    numba = None
+
+if numba is not None and "NUMBA_THREADING_LAYER" not in os.environ:
+    # Conversion jobs are forked from the web worker, and GNU OpenMP aborts in a
+    # forked child once its parent has used it.
+    numba.config.THREADING_LAYER = "forksafe"
+
+try:
+    import pyarrow
+    import pyarrow.parquet
+except ImportError:
+    pyarrow = None
+
+try:
+    import sixdof_kernels
+except ImportError:
+    sixdof_kernels = None
+
 
 FLEXION_VALUES = list(range(0, 91))
 ANTERIOR_TRANSLATION_VALUES = list(range(-10, 11, 2))
@@ -36,6 +73,11 @@ BONE_LIGHTING = dict(
 )
 BONE_LIGHTPOSITION = dict(x=-0.4, y=-1.2, z=1.8)
 KNEE_JOINT_CENTER = np.array([0.0, 0.0, 0.0])
+ANATOMY_DISPLAY_AXES = np.array([
+    [1.0, 0.0, 0.0],
+    [0.0, 0.0, -1.0],
+    [0.0, 1.0, 0.0],
+])
 ANTERIOR_ANATOMY_CAMERA = dict(eye=dict(x=2.35, y=0.0, z=0.15))
 SURFACE_CAMERA = dict(
     eye=dict(x=1.85, y=1.85, z=0.82),
@@ -139,11 +181,6 @@ SIXDOF_EQUATIONS = {
     "ACLam": "(0.332297945918410*(x0 - 34.607643)^2 - 3101.2253)*(-17.1095808141759*x3^2 + x4 - 0.0033823408) + -45.6939620000000*((x0 - 35.403862)*x3 + (x1 + 1/1.5905658*x2 + 15.755187)*(x5 - 0.003627654) + x4 + x4 - 967.635525117490*x5^2 + 0.16718635) - 5.085127",
 }
 
-SIXDOF_MODELS = {
-    name: compile(equation.replace("^", "**"), f"<{name}_6dof_strain>", "eval")
-    for name, equation in SIXDOF_EQUATIONS.items()
-}
-
 SIXDOF_EQUATION_DISPLAY_ORDER = [
     "ACLam",
     "ACLpl",
@@ -170,29 +207,269 @@ REQUIRED_UPLOAD_COLUMNS = (
     "prox",
     "lat",
 )
-MAX_UPLOAD_BYTES = 10 * 1024 * 1024
-MAX_UPLOAD_SAMPLES = 25000
-PLAYBACK_INTERVAL_MS = 250
+UPLOAD_KINEMATIC_COLUMNS = {
+    "flexion": "flex",
+    "adduction": "add",
+    "internal_rotation": "introt",
+    "anterior_translation": "ant",
+    "proximal_translation": "prox",
+    "lateral_translation": "lat",
+}
+OPENSIM_STORAGE_EXTENSIONS = (".mot", ".sto")
+TRIAL_FILE_EXTENSIONS = (".csv",) + OPENSIM_STORAGE_EXTENSIONS
+OPENSIM_COORDINATE_COLUMNS = {
+    "flex": "knee_flex_r",
+    "add": "knee_add_r",
+    "introt": "knee_rot_r",
+    "ant": "knee_tx_r",
+    "prox": "knee_ty_r",
+    "lat": "knee_tz_r",
+}
+OPENSIM_ROTATION_COLUMNS = ("flex", "add", "introt")
+OPENSIM_TRANSLATION_COLUMNS = ("ant", "prox", "lat")
+SIXDOF_STRAIN_ENGINE = os.environ.get("SIXDOF_STRAIN_ENGINE", "fused")
+SIXDOF_INTERACTIVE_ENGINE = "fused" if SIXDOF_STRAIN_ENGINE == "numba" else SIXDOF_STRAIN_ENGINE
+SIXDOF_MONOMIAL_MAX_TERMS = 512
+SIXDOF_ENGINE_TOLERANCE = 1e-6
+SIXDOF_MONOMIAL_BLOCK_SIZE = 1024
+SIXDOF_CHUNK_SIZE = int(os.environ.get("SIXDOF_CHUNK_SIZE", 16384))
+CSV_SPECIAL_CHARACTERS = (",", '"', "\r", "\n")
+G6_SLOTS = 22
+G6_DIGIT_POWERS = (100000, 10000, 1000, 100, 10, 1)
+MAX_UPLOAD_BYTES = int(os.environ.get("MAX_UPLOAD_BYTES", 200 * 1024 * 1024))
+MAX_UPLOAD_SAMPLES = int(os.environ.get("MAX_UPLOAD_SAMPLES", 2_000_000))
+UPLOAD_CHUNK_BYTES = 1024 * 1024
+UPLOAD_CHUNK_ROWS = 16384
+TRIAL_STORE_DIR = Path(os.environ.get("TRIAL_STORE_DIR", Path(tempfile.gettempdir()) / "acl-strain-trials"))
+TRIAL_STORE_MAX_BYTES = int(os.environ.get("TRIAL_STORE_MAX_BYTES", 2 * 1024 * 1024 * 1024))
+RESULT_CACHE_DIR = Path(os.environ.get("RESULT_CACHE_DIR", Path(tempfile.gettempdir()) / "acl-strain-results"))
+RESULT_CACHE_MAX_BYTES = int(os.environ.get("RESULT_CACHE_MAX_BYTES", 1024 * 1024 * 1024))
+CONVERSION_WORKERS = int(os.environ.get(
+    "CONVERSION_WORKERS",
+    len(os.sched_getaffinity(0)) if hasattr(os, "sched_getaffinity") else os.cpu_count() or 1,
+))
+CONVERSION_POOL_MIN_SAMPLES = int(os.environ.get("CONVERSION_POOL_MIN_SAMPLES", 2 * SIXDOF_CHUNK_SIZE))
+DOWNLOAD_ROUTE = "/download/acl-strain"
+UPLOAD_ROUTE = "/upload/trials"
+TRIAL_ID_PATTERN = re.compile(r"[0-9a-f]{64}")
+DOWNLOAD_ZIP_FILENAME = "acl_strain_outputs.zip"
+DOWNLOAD_BATCH_STEM = "acl_strain_outputs"
+DOWNLOAD_TOKEN_PATTERN = re.compile(r"[0-9a-f]{32}")
+DOWNLOAD_BATCH_TTL_SECONDS = 24 * 3600
+DOWNLOAD_FORMAT_OPTIONS = [
+    {"label": "CSV", "value": "csv"},
+    {"label": "Parquet", "value": "parquet", "disabled": pyarrow is None},
+    {"label": "NPZ", "value": "npz"},
+]
+DOWNLOAD_MIMETYPES = {
+    "csv": "text/csv",
+    "parquet": "application/vnd.apache.parquet",
+    "npz": "application/octet-stream",
+}
+SPECULATIVE_CONVERSION = os.environ.get("SPECULATIVE_CONVERSION", "").lower() in {"1", "true", "yes"}
+SPECULATIVE_POLL_SECONDS = 0.1
+SPECULATIVE_HEARTBEAT_SECONDS = 0.5
+SPECULATIVE_STALE_SECONDS = 10.0
+SPECULATIVE_JOB_TTL_SECONDS = 3600
+CONVERSION_POLL_INTERVAL_MS = 150
+CONVERSION_JOB_DIR = Path(os.environ.get("CONVERSION_JOB_DIR", Path(tempfile.gettempdir()) / "acl-strain-jobs"))
+PLAYHEAD_COLOR = "#d55e00"
+PLAYHEAD_SHAPE_INDEX = 1
 PLAYBACK_SPEED_OPTIONS = (
     {"label": "0.25x", "value": 0.25},
     {"label": "0.5x", "value": 0.5},
     {"label": "1x", "value": 1.0},
 )
+TRACE_TIME_TOLERANCE = 1e-3
+PLAYBACK_TRACE_MAX_SAMPLES = int(os.environ.get("PLAYBACK_TRACE_MAX_SAMPLES", 100_000))
+STRAIN_GRAPH_MAX_POINTS = 1500
+
+
+SIXDOF_INPUT_NAMES = ("x0", "x1", "x2", "x3", "x4", "x5")
+SIXDOF_COMMUTATIVE_OPERATORS = (ast.Add, ast.Mult)
+
+
+def sixdof_expression_tree(equation):
+    return ast.parse(equation.replace("^", "**"), mode="eval").body
+
+
+def sixdof_node_key(node, keys):
+    if isinstance(node, ast.BinOp):
+        left_key = keys[id(node.left)]
+        right_key = keys[id(node.right)]
+        if isinstance(node.op, SIXDOF_COMMUTATIVE_OPERATORS) and right_key < left_key:
+            left_key, right_key = right_key, left_key
+        return f"({left_key} {type(node.op).__name__} {right_key})"
+    if isinstance(node, ast.UnaryOp):
+        return f"({type(node.op).__name__} {keys[id(node.operand)]})"
+    if isinstance(node, ast.Name):
+        if node.id not in SIXDOF_INPUT_NAMES:
+            raise ValueError(f"Unknown 6DOF variable: {node.id}")
+        return node.id
+    if isinstance(node, ast.Constant) and isinstance(node.value, (int, float)):
+        return repr(node.value)
+    raise ValueError(f"Unsupported 6DOF expression: {ast.unparse(node)}")
+
+
+def sixdof_subexpressions(node, keys, counts, variable_keys):
+    for child in ast.iter_child_nodes(node):
+        if isinstance(child, ast.expr):
+            sixdof_subexpressions(child, keys, counts, variable_keys)
+
+    key = sixdof_node_key(node, keys)
+    keys[id(node)] = key
+    if isinstance(node, ast.Name) or any(
+        id(child) in variable_keys for child in ast.iter_child_nodes(node)
+    ):
+        variable_keys.add(id(node))
+    if isinstance(node, (ast.BinOp, ast.UnaryOp)) and id(node) in variable_keys:
+        counts[key] = counts.get(key, 0) + 1
+
+
+def fused_sixdof_statements(equations, targets):
+    trees = {target: sixdof_expression_tree(equations[target]) for target in targets}
+    keys = {}
+    counts = {}
+    variable_keys = set()
+    for tree in trees.values():
+        sixdof_subexpressions(tree, keys, counts, variable_keys)
+
+    shared = {key for key, count in counts.items() if count > 1}
+    temporaries = {}
+    statements = []
+
+    def emit(node):
+        key = keys[id(node)]
+        if key in temporaries:
+            return ast.Name(id=temporaries[key], ctx=ast.Load())
+        if isinstance(node, ast.BinOp):
+            emitted = ast.BinOp(left=emit(node.left), op=node.op, right=emit(node.right))
+        elif isinstance(node, ast.UnaryOp):
+            emitted = ast.UnaryOp(op=node.op, operand=emit(node.operand))
+        else:
+            return node
+        if key in shared:
+            temporaries[key] = f"t{len(temporaries)}"
+            statements.append(f"{temporaries[key]} = {ast.unparse(emitted)}")
+            return ast.Name(id=temporaries[key], ctx=ast.Load())
+        return emitted
+
+    results = [ast.unparse(emit(trees[target])) for target in targets]
+    return statements + [f"{target} = {result}" for target, result in zip(targets, results)]
+
+
+def fused_sixdof_kernel_source(equations, targets, function_name="sixdof_fused_kernel"):
+    body = fused_sixdof_statements(equations, targets)
+    body.append(f"return ({', '.join(targets)}{',' if len(targets) == 1 else ''})")
+    return "\n".join([
+        f"def {function_name}({', '.join(SIXDOF_INPUT_NAMES)}):",
+        *[f"    {line}" for line in body],
+        "",
+    ])
+
+
+def parallel_sixdof_kernel_source(equations, targets, function_name="sixdof_parallel_kernel"):
+    array_names = [f"{name}_values" for name in SIXDOF_INPUT_NAMES]
+    body = [f"{name} = {array_name}[index]" for name, array_name in zip(SIXDOF_INPUT_NAMES, array_names)]
+    body += fused_sixdof_statements(equations, targets)
+    body += [f"out[{row}, index] = {target}" for row, target in enumerate(targets)]
+    return "\n".join([
+        f"def {function_name}({', '.join(array_names)}, out):",
+        f"    for index in prange({array_names[0]}.shape[0]):",
+        *[f"        {line}" for line in body],
+        "",
+    ])
+
+
+def sixdof_target_function_name(target):
+    return f"strain_{target}"
+
+
+def sixdof_target_function_source(target, equation):
+    return "\n".join([
+        f"def {sixdof_target_function_name(target)}({', '.join(SIXDOF_INPUT_NAMES)}):",
+        f"    return {ast.unparse(sixdof_expression_tree(equation))}",
+        "",
+    ])
+
+
+def sixdof_equations_hash(equations, targets):
+    payload = json.dumps(
+        {"equations": equations, "targets": list(targets)},
+        sort_keys=True,
+        separators=(",", ":"),
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def sixdof_kernel_module_source(equations, targets):
+    target_functions = [
+        sixdof_target_function_source(target, equations[target])
+        for target in targets
+    ]
+    return "\n\n".join([
+        "\n".join([
+            "# Generated by tools/build_sixdof_kernels.py from SIXDOF_EQUATIONS in app.py.",
+            "# Do not edit by hand; rerun the tool after changing an equation.",
+            "",
+            "try:",
+            "    import numba",
+            "except ImportError:",
+            "    numba = None",
+            "",
+            "prange = numba.prange if numba is not None else range",
+            "",
+            f'SIXDOF_EQUATIONS_HASH = "{sixdof_equations_hash(equations, targets)}"',
+            f"SIXDOF_TARGETS = {tuple(targets)!r}",
+            "",
+        ]),
+        *target_functions,
+        fused_sixdof_kernel_source(equations, targets),
+        parallel_sixdof_kernel_source(equations, targets),
+        "\n".join([
+            "if numba is not None:",
+            "    sixdof_parallel_kernel = numba.njit(parallel=True, cache=True)(sixdof_parallel_kernel)",
+            "",
+        ]),
+        "\n".join([
+            "SIXDOF_TARGET_KERNELS = {",
+            *[f'    "{target}": {sixdof_target_function_name(target)},' for target in targets],
+            "}",
+            "",
+        ]),
+    ])
 
-ACL_FIBER_NAMES = (
-    "ACLam1",
-    "ACLam2",
-    "ACLam3",
-    "ACLam4",
-    "ACLam5",
-    "ACLam6",
-    "ACLpl1",
-    "ACLpl2",
-    "ACLpl3",
-    "ACLpl4",
-    "ACLpl5",
-    "ACLpl6",
-)
+
+def compile_sixdof_kernel(source, function_name="sixdof_fused_kernel"):
+    namespace = {}
+    exec(compile(source, f"<{function_name}>", "exec"), {"__builtins__": {}}, namespace)
+    return namespace[function_name]
+
+
+def load_sixdof_kernels(equations, targets):
+    equations_hash = sixdof_equations_hash(equations, targets)
+    if sixdof_kernels is not None:
+        if getattr(sixdof_kernels, "SIXDOF_EQUATIONS_HASH", None) == equations_hash:
+            return sixdof_kernels.SIXDOF_TARGET_KERNELS, sixdof_kernels.sixdof_fused_kernel
+        warnings.warn(
+            "sixdof_kernels.py is stale for the current SIXDOF_EQUATIONS; "
+            "compiling strain kernels at runtime. Run tools/build_sixdof_kernels.py to regenerate it.",
+            stacklevel=2,
+        )
+
+    target_kernels = {
+        target: compile_sixdof_kernel(
+            sixdof_target_function_source(target, equations[target]),
+            sixdof_target_function_name(target),
+        )
+        for target in targets
+    }
+    fused_kernel = compile_sixdof_kernel(fused_sixdof_kernel_source(equations, targets))
+    return target_kernels, fused_kernel
+
+
+SIXDOF_EQUATIONS_HASH = sixdof_equations_hash(SIXDOF_EQUATIONS, CONVERSION_OUTPUT_COLUMNS)
+SIXDOF_MODELS, SIXDOF_FUSED_KERNEL = load_sixdof_kernels(SIXDOF_EQUATIONS, CONVERSION_OUTPUT_COLUMNS)
 
 
 def sixdof_variables(
@@ -203,14 +480,14 @@ def sixdof_variables(
     lateral_translation,
     proximal_translation,
 ):
-    return {
-        "x0": flexion,
-        "x1": adduction,
-        "x2": internal_rotation,
-        "x3": anterior_translation / 1000,
-        "x4": proximal_translation / 1000,
-        "x5": lateral_translation / 1000,
-    }
+    return (
+        flexion,
+        adduction,
+        internal_rotation,
+        anterior_translation / 1000,
+        proximal_translation / 1000,
+        lateral_translation / 1000,
+    )
 
 
 def calculate_6dof_strain(
@@ -222,37 +499,293 @@ def calculate_6dof_strain(
     lateral_translation,
     proximal_translation,
 ):
-    variables = sixdof_variables(
+    strains = calculate_6dof_strain_columns(
         flexion=flexion,
         adduction=adduction,
         internal_rotation=internal_rotation,
         anterior_translation=anterior_translation,
         lateral_translation=lateral_translation,
         proximal_translation=proximal_translation,
+        targets=(target,),
+        engine=SIXDOF_INTERACTIVE_ENGINE,
+    )
+    return strains[target][()]
+
+
+def sixdof_polynomial(node):
+    constant_key = (0,) * len(SIXDOF_INPUT_NAMES)
+
+    def scaled(polynomial, factor):
+        return {key: coefficient * factor for key, coefficient in polynomial.items()}
+
+    def combined(left, right, sign):
+        result = dict(left)
+        for key, coefficient in right.items():
+            result[key] = result.get(key, 0.0) + sign * coefficient
+        return result
+
+    def product(left, right):
+        result = {}
+        for left_key, left_coefficient in left.items():
+            for right_key, right_coefficient in right.items():
+                key = tuple(a + b for a, b in zip(left_key, right_key))
+                result[key] = result.get(key, 0.0) + left_coefficient * right_coefficient
+        return result
+
+    def constant_value(polynomial):
+        if set(polynomial) - {constant_key}:
+            raise ValueError(f"Not a polynomial: {ast.unparse(node)}")
+        return polynomial.get(constant_key, 0.0)
+
+    if isinstance(node, ast.Constant):
+        return {constant_key: float(node.value)}
+    if isinstance(node, ast.Name):
+        exponents = [0] * len(SIXDOF_INPUT_NAMES)
+        exponents[SIXDOF_INPUT_NAMES.index(node.id)] = 1
+        return {tuple(exponents): 1.0}
+    if isinstance(node, ast.UnaryOp):
+        operand = sixdof_polynomial(node.operand)
+        return scaled(operand, -1.0) if isinstance(node.op, ast.USub) else operand
+    if not isinstance(node, ast.BinOp):
+        raise ValueError(f"Unsupported 6DOF expression: {ast.unparse(node)}")
+
+    left = sixdof_polynomial(node.left)
+    right = sixdof_polynomial(node.right)
+    if isinstance(node.op, ast.Add):
+        return combined(left, right, 1.0)
+    if isinstance(node.op, ast.Sub):
+        return combined(left, right, -1.0)
+    if isinstance(node.op, ast.Mult):
+        return product(left, right)
+    if isinstance(node.op, ast.Div):
+        return scaled(left, 1 / constant_value(right))
+    if isinstance(node.op, ast.Pow):
+        exponent = constant_value(right)
+        if exponent < 0 or exponent != int(exponent):
+            raise ValueError(f"Not a polynomial: {ast.unparse(node)}")
+        result = {constant_key: 1.0}
+        for _ in range(int(exponent)):
+            result = product(result, left)
+        return result
+    raise ValueError(f"Unsupported 6DOF expression: {ast.unparse(node)}")
+
+
+def monomial_basis_closure(monomials):
+    basis = set(monomials)
+    pending = list(monomials)
+    while pending:
+        monomial = pending.pop()
+        for index, exponent in enumerate(monomial):
+            if exponent:
+                parent = monomial[:index] + (exponent - 1,) + monomial[index + 1:]
+                if parent not in basis:
+                    basis.add(parent)
+                    pending.append(parent)
+                break
+    return sorted(basis, key=lambda monomial: (sum(monomial), monomial))
+
+
+def sixdof_probe_variables(sample_count=4096):
+    generator = np.random.default_rng(2015)
+    return sixdof_variables(
+        flexion=generator.uniform(min(FLEXION_VALUES), max(FLEXION_VALUES), sample_count),
+        adduction=generator.uniform(min(ADDUCTION_VALUES), max(ADDUCTION_VALUES), sample_count),
+        internal_rotation=generator.uniform(min(INTERNAL_ROTATION_VALUES), max(INTERNAL_ROTATION_VALUES), sample_count),
+        anterior_translation=generator.uniform(min(ANTERIOR_TRANSLATION_VALUES), max(ANTERIOR_TRANSLATION_VALUES), sample_count),
+        lateral_translation=generator.uniform(min(LATERAL_TRANSLATION_VALUES), max(LATERAL_TRANSLATION_VALUES), sample_count),
+        proximal_translation=generator.uniform(min(PROXIMAL_TRANSLATION_VALUES), max(PROXIMAL_TRANSLATION_VALUES), sample_count),
     )
-    return eval(SIXDOF_MODELS[target], {"__builtins__": {}}, variables)
 
 
-def calculate_6dof_individual_fiber_strains(
+@lru_cache(maxsize=1)
+def sixdof_monomial_model():
+    polynomials = {}
+    for target in CONVERSION_OUTPUT_COLUMNS:
+        try:
+            polynomial = sixdof_polynomial(sixdof_expression_tree(SIXDOF_EQUATIONS[target]))
+        except ValueError:
+            continue
+        polynomial = {key: value for key, value in polynomial.items() if value != 0.0}
+        if len(polynomial) <= SIXDOF_MONOMIAL_MAX_TERMS:
+            polynomials[target] = polynomial
+
+    basis = monomial_basis_closure({key for polynomial in polynomials.values() for key in polynomial})
+    basis_index = {monomial: index for index, monomial in enumerate(basis)}
+    parents = []
+    for monomial in basis:
+        variable_index = next((index for index, exponent in enumerate(monomial) if exponent), None)
+        if variable_index is None:
+            parents.append((None, None))
+            continue
+        parent = monomial[:variable_index] + (monomial[variable_index] - 1,) + monomial[variable_index + 1:]
+        parents.append((basis_index[parent], variable_index))
+
+    targets = tuple(polynomials)
+    coefficients = np.zeros((len(basis), len(targets)))
+    for target_index, target in enumerate(targets):
+        for monomial, coefficient in polynomials[target].items():
+            coefficients[basis_index[monomial], target_index] = coefficient
+
+    model = {"parents": parents, "targets": targets, "coefficients": coefficients}
+    probe_variables = sixdof_probe_variables()
+    probe_values = monomial_features(probe_variables, model) @ coefficients
+    accurate_targets = [
+        index
+        for index, target in enumerate(targets)
+        if np.max(np.abs(probe_values[:, index] - SIXDOF_MODELS[target](*probe_variables)))
+        <= SIXDOF_ENGINE_TOLERANCE
+    ]
+    model["targets"] = tuple(targets[index] for index in accurate_targets)
+    model["coefficients"] = coefficients[:, accurate_targets]
+    return model
+
+
+def monomial_features(variables, model):
+    sample_count = len(variables[0])
+    features = np.empty((sample_count, len(model["parents"])), order="F")
+    for column, (parent, variable_index) in enumerate(model["parents"]):
+        if parent is None:
+            features[:, column] = 1.0
+        else:
+            np.multiply(features[:, parent], variables[variable_index], out=features[:, column])
+    return features
+
+
+def fused_strain_columns(variables, targets):
+    strains = dict(zip(CONVERSION_OUTPUT_COLUMNS, SIXDOF_FUSED_KERNEL(*variables)))
+    return {target: strains[target] for target in targets}
+
+
+def monomial_strain_columns(variables, targets):
+    variables = np.broadcast_arrays(*variables)
+    shape = variables[0].shape
+    flat_variables = [variable.ravel() for variable in variables]
+    model = sixdof_monomial_model()
+    polynomial_targets = [target for target in model["targets"] if target in targets]
+    strains = {}
+    if polynomial_targets:
+        columns = [model["targets"].index(target) for target in polynomial_targets]
+        coefficients = model["coefficients"][:, columns]
+        sample_count = flat_variables[0].size
+        values = np.empty((sample_count, len(columns)))
+        for start in range(0, sample_count, SIXDOF_MONOMIAL_BLOCK_SIZE):
+            stop = start + SIXDOF_MONOMIAL_BLOCK_SIZE
+            features = monomial_features([variable[start:stop] for variable in flat_variables], model)
+            np.matmul(features, coefficients, out=values[start:stop])
+        for index, target in enumerate(polynomial_targets):
+            strains[target] = values[:, index].reshape(shape)
+    for target in targets:
+        if target not in strains:
+            strains[target] = SIXDOF_MODELS[target](*variables)
+    return {target: strains[target] for target in targets}
+
+
+SIXDOF_PARALLEL_KERNEL_LOCK = threading.Lock()
+
+
+@lru_cache(maxsize=1)
+def sixdof_parallel_kernel():
+    if numba is None:
+        return None
+
+    if getattr(sixdof_kernels, "SIXDOF_EQUATIONS_HASH", None) == SIXDOF_EQUATIONS_HASH:
+        kernel = sixdof_kernels.sixdof_parallel_kernel
+    else:
+        namespace = {}
+        source = parallel_sixdof_kernel_source(SIXDOF_EQUATIONS, CONVERSION_OUTPUT_COLUMNS)
+        exec(compile(source, "<sixdof_parallel_kernel>", "exec"), {"prange": numba.prange}, namespace)
+        kernel = numba.njit(parallel=True)(namespace["sixdof_parallel_kernel"])
+
+    probe_variables = sixdof_probe_variables()
+    probe_values = np.empty((len(CONVERSION_OUTPUT_COLUMNS), len(probe_variables[0])))
+    kernel(*probe_variables, probe_values)
+    expected_values = np.array(SIXDOF_FUSED_KERNEL(*probe_variables))
+    if not np.allclose(probe_values, expected_values, rtol=0, atol=SIXDOF_ENGINE_TOLERANCE):
+        warnings.warn(
+            "Numba strain kernel does not match the fused kernel; using the NumPy path instead.",
+            stacklevel=2,
+        )
+        return None
+    return kernel
+
+
+def parallel_strain_columns(variables, targets):
+    # The workqueue threading layer aborts the process if two threads enter a
+    # parallel kernel at once, so kernel entry is serialized.
+    with SIXDOF_PARALLEL_KERNEL_LOCK:
+        kernel = sixdof_parallel_kernel()
+    if kernel is None:
+        return fused_strain_columns(variables, targets)
+
+    variables = np.broadcast_arrays(*variables)
+    shape = variables[0].shape
+    flat_variables = [np.ascontiguousarray(variable, dtype=float).ravel() for variable in variables]
+    values = np.empty((len(CONVERSION_OUTPUT_COLUMNS), flat_variables[0].size))
+    with SIXDOF_PARALLEL_KERNEL_LOCK:
+        kernel(*flat_variables, values)
+    return {
+        target: values[CONVERSION_OUTPUT_COLUMNS.index(target)].reshape(shape)
+        for target in targets
+    }
+
+
+SIXDOF_STRAIN_ENGINES = {
+    "fused": fused_strain_columns,
+    "monomial": monomial_strain_columns,
+    "numba": parallel_strain_columns,
+}
+
+
+def calculate_6dof_strain_columns(
     flexion,
     adduction,
     internal_rotation,
     anterior_translation,
     lateral_translation,
     proximal_translation,
+    targets=CONVERSION_OUTPUT_COLUMNS,
+    engine=None,
+    chunk_size=None,
+    dtype=np.float64,
+    out=None,
+    progress=None,
 ):
-    return {
-        fiber_name: calculate_6dof_strain(
-            target=fiber_name,
-            flexion=flexion,
-            adduction=adduction,
-            internal_rotation=internal_rotation,
-            anterior_translation=anterior_translation,
-            lateral_translation=lateral_translation,
-            proximal_translation=proximal_translation,
+    engine = engine or SIXDOF_STRAIN_ENGINE
+    if engine not in SIXDOF_STRAIN_ENGINES:
+        raise ValueError(f"Unknown strain engine: {engine}")
+    chunk_size = max(int(chunk_size or SIXDOF_CHUNK_SIZE), 1)
+
+    kinematics = np.broadcast_arrays(*[
+        np.asarray(values, dtype=float)
+        for values in (
+            flexion,
+            adduction,
+            internal_rotation,
+            anterior_translation,
+            lateral_translation,
+            proximal_translation,
         )
-        for fiber_name in ACL_FIBER_NAMES
-    }
+    ])
+    shape = kinematics[0].shape
+    flat_kinematics = [values.reshape(-1) for values in kinematics]
+    sample_count = flat_kinematics[0].size
+
+    if out is None:
+        out = {target: np.empty(shape, dtype=dtype) for target in targets}
+    for target in targets:
+        if out[target].shape != shape or not out[target].flags.c_contiguous:
+            raise ValueError(f"Output array for {target} must be C-contiguous with shape {shape}.")
+    flat_out = {target: out[target].reshape(-1) for target in targets}
+
+    for start in range(0, sample_count, chunk_size):
+        stop = min(start + chunk_size, sample_count)
+        variables = sixdof_variables(*[values[start:stop] for values in flat_kinematics])
+        strains = SIXDOF_STRAIN_ENGINES[engine](variables, targets)
+        for target in targets:
+            flat_out[target][start:stop] = strains[target]
+        if progress is not None:
+            progress(stop)
+    return out
 
 
 def calculate_bundle_strain(
@@ -275,104 +808,1133 @@ def calculate_bundle_strain(
     )
 
 
-def parse_uploaded_csv(contents, filename):
+def first_invalid_number_index(values):
+    for index, value in enumerate(values):
+        try:
+            float(value)
+        except ValueError:
+            return index
+    return None
+
+
+def csv_lines_from_columns(columns, text_columns):
+    lines = [",".join(row) for row in zip(*columns)]
+    quoted_rows = {
+        index
+        for column in text_columns
+        for index, value in enumerate(columns[column])
+        if any(character in value for character in CSV_SPECIAL_CHARACTERS)
+    }
+    for index in sorted(quoted_rows):
+        line = io.StringIO()
+        csv.writer(line, lineterminator="\n").writerow([values[index] for values in columns])
+        lines[index] = line.getvalue()[:-1]
+    return lines
+
+
+def parse_csv_block(rows, headers, row_numbers):
+    width = len(headers)
+    has_overflow = np.zeros(len(rows), dtype=bool)
+    for index, row in enumerate(rows):
+        if len(row) != width:
+            has_overflow[index] = any(value.strip() for value in row[width:])
+            rows[index] = (row + [""] * width)[:width]
+
+    numeric_indices = {headers.index(column) for column in REQUIRED_UPLOAD_COLUMNS}
+    cells = [
+        np.char.strip(np.array([row[index] for row in rows], dtype=str))
+        if index in numeric_indices else [row[index].strip() for row in rows]
+        for index in range(width)
+    ]
+    keep = has_overflow.copy()
+    for values in cells:
+        keep |= (values != "") if isinstance(values, np.ndarray) else np.array([bool(value) for value in values], dtype=bool)
+    kept_rows = np.flatnonzero(keep).tolist()
+    cells = [
+        values[keep] if isinstance(values, np.ndarray) else [values[index] for index in kept_rows]
+        for values in cells
+    ]
+    row_numbers = np.asarray(row_numbers)[keep]
+
+    columns = {}
+    invalid_values = []
+    for column_order, column in enumerate(REQUIRED_UPLOAD_COLUMNS):
+        text_values = cells[headers.index(column)]
+        try:
+            columns[column] = text_values.astype(np.float64)
+        except ValueError:
+            invalid_index = first_invalid_number_index(text_values.tolist())
+            if invalid_index is None:
+                columns[column] = np.array([float(value) for value in text_values.tolist()])
+            else:
+                invalid_values.append((int(row_numbers[invalid_index]), column_order, column))
+
+    if invalid_values:
+        row_number, _, column = min(invalid_values)
+        raise ValueError(f"Invalid numeric value in {column} at CSV row {row_number}.")
+
+    return {
+        "columns": columns,
+        "input_lines": csv_lines_from_columns(
+            [values.tolist() if isinstance(values, np.ndarray) else values for values in cells],
+            [index for index in range(width) if index not in numeric_indices],
+        ),
+        "row_count": len(kept_rows),
+    }
+
+
+def iter_base64_bytes(encoded, chunk_bytes=UPLOAD_CHUNK_BYTES):
+    chunk_characters = max(chunk_bytes // 3, 1) * 4
+    for start in range(0, len(encoded), chunk_characters):
+        yield base64.b64decode(encoded[start:start + chunk_characters])
+
+
+def iter_file_bytes(handle, chunk_bytes=UPLOAD_CHUNK_BYTES):
+    while True:
+        chunk = handle.read(chunk_bytes)
+        if not chunk:
+            return
+        yield chunk
+
+
+def spool_byte_chunks(byte_chunks, chunk_bytes=UPLOAD_CHUNK_BYTES):
+    spool = tempfile.SpooledTemporaryFile(max_size=8 * chunk_bytes)
+    digest = hashlib.sha256()
+    size = 0
+    for chunk in byte_chunks:
+        size += len(chunk)
+        if size > MAX_UPLOAD_BYTES:
+            spool.close()
+            raise ValueError(f"File is larger than the {MAX_UPLOAD_BYTES // (1024 * 1024)} MB upload limit.")
+        digest.update(chunk)
+        spool.write(chunk)
+    spool.seek(0)
+    return spool, digest.hexdigest()
+
+
+def spool_upload_stream(stream, chunk_bytes=UPLOAD_CHUNK_BYTES):
+    return spool_byte_chunks(iter_file_bytes(stream, chunk_bytes), chunk_bytes)
+
+
+def iter_gunzip_bytes(byte_chunks, chunk_bytes=UPLOAD_CHUNK_BYTES):
+    decompressor = zlib.decompressobj(16 + zlib.MAX_WBITS)
+    size = 0
+    try:
+        for data in byte_chunks:
+            while data:
+                if decompressor.eof:
+                    data = decompressor.unused_data + data
+                    decompressor = zlib.decompressobj(16 + zlib.MAX_WBITS)
+                output = decompressor.decompress(data, chunk_bytes)
+                data = decompressor.unconsumed_tail
+                size += len(output)
+                if size > MAX_UPLOAD_BYTES:
+                    raise ValueError(f"Decompressed file is larger than the {MAX_UPLOAD_BYTES // (1024 * 1024)} MB upload limit.")
+                if output:
+                    yield output
+    except zlib.error as exc:
+        raise ValueError("Invalid gzip data.") from exc
+    if not decompressor.eof:
+        raise ValueError("Truncated gzip data.")
+
+
+def iter_zip_member_bytes(archive, info, chunk_bytes=UPLOAD_CHUNK_BYTES):
+    try:
+        with archive.open(info) as member:
+            yield from iter_file_bytes(member, chunk_bytes)
+    except (zipfile.BadZipFile, zlib.error, NotImplementedError) as exc:
+        raise ValueError(f"Could not read archive member: {exc}") from exc
+
+
+def iter_source_error(message):
+    raise ValueError(message)
+    yield
+
+
+def spool_chunk_source(spool):
+    def open_chunks():
+        spool.seek(0)
+        return iter_file_bytes(spool)
+    return open_chunks
+
+
+def iter_trial_sources(filename, spool, trial_id):
+    name = filename or "uploaded_trial.csv"
+    open_spool = spool_chunk_source(spool)
+    if name.lower().endswith(".gz"):
+        yield name[:-3], lambda: iter_gunzip_bytes(open_spool()), None
+        return
+    if not name.lower().endswith(".zip"):
+        yield name, open_spool, trial_id
+        return
+
+    try:
+        archive = zipfile.ZipFile(spool)
+    except zipfile.BadZipFile:
+        yield name, lambda: iter_source_error("Invalid zip archive."), None
+        return
+
+    member_count = 0
+    with archive:
+        for info in archive.infolist():
+            member_path = Path(info.filename)
+            member_name = f"{Path(name).name}/{info.filename}"
+            if info.is_dir() or "__MACOSX" in member_path.parts or member_path.name.startswith("."):
+                continue
+            member_file = member_path.name.lower()
+            compressed = member_file.endswith(".gz")
+            if not (member_file[:-3] if compressed else member_file).endswith(TRIAL_FILE_EXTENSIONS):
+                continue
+            member_count += 1
+            if compressed:
+                yield member_name[:-3], lambda info=info: iter_gunzip_bytes(iter_zip_member_bytes(archive, info)), None
+            elif info.file_size > MAX_UPLOAD_BYTES:
+                yield member_name, lambda: iter_source_error(
+                    f"File is larger than the {MAX_UPLOAD_BYTES // (1024 * 1024)} MB upload limit."
+                ), None
+            else:
+                yield member_name, lambda info=info: iter_zip_member_bytes(archive, info), None
+    if not member_count:
+        yield name, lambda: iter_source_error("No trial files found in the archive."), None
+
+
+def iter_decoded_text(byte_chunks):
+    decoder = codecs.getincrementaldecoder("utf-8-sig")()
+    for chunk in byte_chunks:
+        yield decoder.decode(chunk)
+    tail = decoder.decode(b"", final=True)
+    if tail:
+        yield tail
+
+
+def content_hash(byte_chunks):
+    digest = hashlib.sha256()
+    for chunk in byte_chunks:
+        digest.update(chunk)
+    return digest.hexdigest()
+
+
+def iter_text_lines(text_chunks):
+    pending = ""
+    for chunk in text_chunks:
+        lines = (pending + chunk).split("\n")
+        pending = lines.pop()
+        for line in lines:
+            yield line + "\n"
+    if pending:
+        yield pending
+
+
+def iter_csv_line_blocks(text_chunks, chunk_rows=UPLOAD_CHUNK_ROWS):
+    pending = ""
+    lines = []
+    for chunk in text_chunks:
+        lines.extend((pending + chunk).split("\n"))
+        pending = lines.pop()
+        while len(lines) >= chunk_rows:
+            yield lines[:chunk_rows]
+            del lines[:chunk_rows]
+    if pending:
+        lines.append(pending)
+    if lines:
+        yield lines
+
+
+def csv_quoted_records(lines):
+    # Rejoin physical lines until the quotes balance, so a quoted newline stays
+    # inside its field; an unbalanced tail is carried into the next block.
+    records = []
+    record = None
+    for line in lines:
+        record = line if record is None else f"{record}\n{line}"
+        if record.count('"') % 2 == 0:
+            records.append(record)
+            record = None
+    return records, record
+
+
+def parse_plain_csv_block(lines, headers):
+    # Blocks without quotes keep their raw lines and parse the numeric columns in
+    # one pass; anything irregular returns None and goes through parse_csv_block.
+    if any(line.endswith("\r") for line in lines):
+        lines = [line[:-1] if line.endswith("\r") else line for line in lines]
+    if "" in lines:
+        lines = [line for line in lines if line]
+    width = len(headers)
+    if not lines or any(line.count(",") != width - 1 or "\r" in line for line in lines):
+        return None
+    try:
+        values = np.loadtxt(
+            lines,
+            delimiter=",",
+            comments=None,
+            usecols=[headers.index(column) for column in REQUIRED_UPLOAD_COLUMNS],
+            dtype=np.float64,
+            ndmin=2,
+        )
+    except ValueError:
+        return None
+    return {
+        "columns": {
+            column: np.ascontiguousarray(values[:, order])
+            for order, column in enumerate(REQUIRED_UPLOAD_COLUMNS)
+        },
+        "input_lines": lines,
+        "row_count": len(lines),
+    }
+
+
+def iter_csv_blocks(text_chunks, chunk_rows=UPLOAD_CHUNK_ROWS):
+    headers = None
+    row_number = 1
+    carry = None
+
+    def parse_records(records):
+        nonlocal row_number
+        rows = []
+        row_numbers = []
+        for row in csv.reader(records):
+            if not row:
+                continue
+            row_number += 1
+            rows.append(row)
+            row_numbers.append(row_number)
+        return parse_csv_block(rows, headers, row_numbers) if rows else None
+
+    for lines in iter_csv_line_blocks(text_chunks, chunk_rows):
+        if carry is not None:
+            lines[0] = f"{carry}\n{lines[0]}"
+        carry = None
+        quoted = any('"' in line for line in lines)
+        if quoted:
+            lines, carry = csv_quoted_records(lines)
+        if headers is None:
+            headers = next(csv.reader(lines[:1]), [])
+            missing_columns = [column for column in REQUIRED_UPLOAD_COLUMNS if column not in headers]
+            if missing_columns:
+                raise ValueError(f"Missing required columns: {', '.join(missing_columns)}")
+            yield headers
+            lines = lines[1:]
+
+        block = None if quoted else parse_plain_csv_block(lines, headers)
+        if block is None:
+            block = parse_records(lines)
+        else:
+            row_number += block["row_count"]
+        if block is not None:
+            yield block
+
+    if headers is None:
+        raise ValueError(f"Missing required columns: {', '.join(REQUIRED_UPLOAD_COLUMNS)}")
+    if carry is not None:
+        block = parse_records([carry])
+        if block is not None:
+            yield block
+
+
+def opensim_column_index(labels, coordinate):
+    for index, label in enumerate(labels):
+        if label == coordinate or label.endswith(f"/{coordinate}/value") or label.endswith(f"/{coordinate}"):
+            return index
+    return None
+
+
+def parse_opensim_block(rows, width, first_row_number):
+    values = " ".join(rows).split()
+    if len(values) != len(rows) * width:
+        for offset, row in enumerate(rows):
+            if len(row.split()) != width:
+                raise ValueError(f"Expected {width} values at OpenSim data row {first_row_number + offset}.")
+    try:
+        return np.array(values, dtype=np.float64).reshape(len(rows), width)
+    except ValueError:
+        for offset, row in enumerate(rows):
+            if first_invalid_number_index(row.split()) is not None:
+                raise ValueError(f"Invalid numeric value at OpenSim data row {first_row_number + offset}.")
+        raise
+
+
+def opensim_block(data, in_degrees):
+    columns = {column: np.ascontiguousarray(data[:, order]) for order, column in enumerate(REQUIRED_UPLOAD_COLUMNS)}
+    if not in_degrees:
+        for column in OPENSIM_ROTATION_COLUMNS:
+            columns[column] = np.degrees(columns[column])
+    for column in OPENSIM_TRANSLATION_COLUMNS:
+        columns[column] = columns[column] * 1000.0
+
+    values = np.column_stack([columns[column] for column in REQUIRED_UPLOAD_COLUMNS]).tolist()
+    return {
+        "columns": columns,
+        "input_lines": [",".join(map(repr, row)) for row in values],
+        "row_count": len(values),
+    }
+
+
+def iter_opensim_blocks(text_chunks, chunk_rows=UPLOAD_CHUNK_ROWS):
+    lines = iter_text_lines(text_chunks)
+    in_degrees = True
+    for line in lines:
+        setting = line.strip()
+        if setting.lower() == "endheader":
+            break
+        key, _, value = setting.partition("=")
+        if key.strip().lower() == "indegrees":
+            in_degrees = value.strip().lower() != "no"
+    else:
+        raise ValueError("Missing endheader line in OpenSim file.")
+
+    labels = next((line.split() for line in lines if line.strip()), [])
+    coordinates = {"time": "time", **OPENSIM_COORDINATE_COLUMNS}
+    indices = {column: opensim_column_index(labels, coordinates[column]) for column in REQUIRED_UPLOAD_COLUMNS}
+    missing_coordinates = [coordinates[column] for column, index in indices.items() if index is None]
+    if missing_coordinates:
+        raise ValueError(f"Missing OpenSim coordinates: {', '.join(missing_coordinates)}")
+
+    yield list(REQUIRED_UPLOAD_COLUMNS)
+    selected = [indices[column] for column in REQUIRED_UPLOAD_COLUMNS]
+    rows = []
+    row_count = 0
+    for line in lines:
+        if line.strip():
+            rows.append(line)
+        if len(rows) >= chunk_rows:
+            yield opensim_block(parse_opensim_block(rows, len(labels), row_count + 1)[:, selected], in_degrees)
+            row_count += len(rows)
+            rows = []
+    if rows:
+        yield opensim_block(parse_opensim_block(rows, len(labels), row_count + 1)[:, selected], in_degrees)
+
+
+def trial_block_reader(filename):
+    if (filename or "").lower().endswith(OPENSIM_STORAGE_EXTENSIONS):
+        return iter_opensim_blocks
+    return iter_csv_blocks
+
+
+def uploaded_base64(contents):
     if not contents or "," not in contents:
         raise ValueError("Missing upload contents.")
 
     _, encoded = contents.split(",", 1)
     approximate_bytes = (len(encoded) * 3) // 4
     if approximate_bytes > MAX_UPLOAD_BYTES:
-        raise ValueError("File is larger than the 10 MB upload limit.")
+        raise ValueError(f"File is larger than the {MAX_UPLOAD_BYTES // (1024 * 1024)} MB upload limit.")
+    return encoded
 
-    decoded = base64.b64decode(encoded).decode("utf-8-sig")
-    reader = csv.DictReader(io.StringIO(decoded))
-    headers = reader.fieldnames or []
-    missing_columns = [column for column in REQUIRED_UPLOAD_COLUMNS if column not in headers]
-    if missing_columns:
-        raise ValueError(f"Missing required columns: {', '.join(missing_columns)}")
 
-    rows = []
-    for row_index, row in enumerate(reader, start=2):
-        if not any((value or "").strip() for value in row.values()):
+def store_path(directory, key):
+    # Keys come back from browser-held stores, so only a trial hash (optionally
+    # suffixed with the equations hash) may name a file.
+    trial_id, _, suffix = str(key).partition("-")
+    if not TRIAL_ID_PATTERN.fullmatch(trial_id) or suffix not in ("", SIXDOF_EQUATIONS_HASH):
+        return None
+    return directory / f"{key}.npz"
+
+
+def evict_store(directory, max_bytes):
+    entries = []
+    for path in directory.glob("*.npz"):
+        try:
+            stat = path.stat()
+        except FileNotFoundError:
             continue
-        cleaned_row = {header: (row.get(header, "") or "").strip() for header in headers}
-        for column in REQUIRED_UPLOAD_COLUMNS:
+        entries.append((stat.st_mtime, stat.st_size, path))
+
+    total_bytes = sum(size for _, size, _ in entries)
+    for _, size, path in sorted(entries):
+        if total_bytes <= max_bytes:
+            break
+        try:
+            path.unlink()
+        except FileNotFoundError:
+            pass
+        total_bytes -= size
+
+
+def write_spooled_npz(handle, arrays, spooled):
+    # Same layout as np.savez, but spooled members are copied from their temp
+    # files so a whole array never has to be held in memory.
+    with zipfile.ZipFile(handle, mode="w", compression=zipfile.ZIP_STORED) as archive:
+        for name, values in arrays.items():
+            with archive.open(f"{name}.npy", mode="w", force_zip64=True) as member:
+                np.lib.format.write_array(member, np.asanyarray(values), allow_pickle=False)
+        for name, (spool, dtype) in spooled.items():
+            length = spool.tell() // np.dtype(dtype).itemsize
+            spool.seek(0)
+            with archive.open(f"{name}.npy", mode="w", force_zip64=True) as member:
+                write_npy_header(member, dtype, length)
+                shutil.copyfileobj(spool, member, UPLOAD_CHUNK_BYTES)
+
+
+def save_store_arrays(directory, key, arrays, max_bytes, spooled=None):
+    path = store_path(directory, key)
+    if path is None:
+        raise ValueError("Invalid trial id.")
+    directory.mkdir(parents=True, exist_ok=True)
+    with tempfile.NamedTemporaryFile(dir=directory, suffix=".tmp", delete=False) as handle:
+        if spooled:
+            write_spooled_npz(handle, arrays, spooled)
+        else:
+            np.savez(handle, **arrays)
+    os.replace(handle.name, path)
+    evict_store(directory, max_bytes)
+
+
+def touch_store_entry(directory, key):
+    path = store_path(directory, key)
+    if path is None:
+        return False
+    try:
+        os.utime(path)
+        return True
+    except FileNotFoundError:
+        return False
+
+
+def load_store_arrays(directory, key, names=None):
+    path = store_path(directory, key)
+    if path is None:
+        return None
+    try:
+        with np.load(path, allow_pickle=False) as archive:
+            return {name: archive[name] for name in (archive.files if names is None else names)}
+    except FileNotFoundError:
+        return None
+
+
+TRIAL_COLUMN_ARRAYS = ("headers",) + tuple(f"column_{column}" for column in REQUIRED_UPLOAD_COLUMNS)
+
+
+def trial_from_store_arrays(arrays):
+    times = arrays["column_time"]
+    return {
+        "headers": arrays["headers"].tolist(),
+        "columns": {column: arrays[f"column_{column}"] for column in REQUIRED_UPLOAD_COLUMNS},
+        "row_count": len(times),
+        "time_sorted": bool(np.all(times[1:] >= times[:-1])),
+    }
+
+
+@lru_cache(maxsize=8)
+def cached_trial(trial_id):
+    # Only the numeric columns are cached; the passthrough text is read from the
+    # store when a CSV download needs it.
+    arrays = load_store_arrays(TRIAL_STORE_DIR, trial_id, TRIAL_COLUMN_ARRAYS)
+    return trial_from_store_arrays(arrays) if arrays is not None else None
+
+
+def iter_trial_input_lines(trial_id, chunk_rows=UPLOAD_CHUNK_ROWS):
+    arrays = load_store_arrays(TRIAL_STORE_DIR, trial_id, ("input_text", "input_offsets"))
+    input_text = arrays["input_text"].tobytes().decode("utf-8")
+    offsets = arrays["input_offsets"]
+    for start in range(0, len(offsets) - 1, chunk_rows):
+        bounds = offsets[start:start + chunk_rows + 1].tolist()
+        yield [input_text[low:high] for low, high in zip(bounds, bounds[1:])]
+
+
+def load_trial(trial_id):
+    if not touch_store_entry(TRIAL_STORE_DIR, trial_id):
+        return None
+    trial = cached_trial(trial_id)
+    if trial is None:
+        cached_trial.cache_clear()
+    return trial
+
+
+def stored_trial_row_count(trial_id):
+    if not touch_store_entry(TRIAL_STORE_DIR, trial_id):
+        return None
+    try:
+        with np.load(store_path(TRIAL_STORE_DIR, trial_id), allow_pickle=False) as archive:
+            return len(archive["input_offsets"]) - 1
+    except FileNotFoundError:
+        return None
+
+
+def save_trial_blocks(trial_id, blocks, max_samples=None):
+    headers = next(blocks)
+    column_names = {column: f"column_{column}" for column in REQUIRED_UPLOAD_COLUMNS}
+    with contextlib.ExitStack() as stack:
+        spooled = {
+            name: (stack.enter_context(tempfile.TemporaryFile()), dtype)
+            for name, dtype in [("input_text", "u1"), ("input_offsets", "<i8")]
+            + [(name, "<f8") for name in column_names.values()]
+        }
+        spooled["input_offsets"][0].write(np.zeros(1, dtype="<i8").tobytes())
+        row_count = 0
+        text_length = 0
+        for block in blocks:
+            row_count += block["row_count"]
+            if max_samples is not None and row_count > max_samples:
+                raise ValueError(f"Upload exceeds the {MAX_UPLOAD_SAMPLES} total sample limit.")
+            # Offsets count characters of the decoded text, as trial_from_store_arrays slices it.
+            lengths = np.fromiter(map(len, block["input_lines"]), dtype=np.int64, count=block["row_count"])
+            spooled["input_text"][0].write("".join(block["input_lines"]).encode("utf-8"))
+            spooled["input_offsets"][0].write((text_length + np.cumsum(lengths)).astype("<i8").tobytes())
+            text_length += int(lengths.sum())
+            for column, name in column_names.items():
+                spooled[name][0].write(np.asarray(block["columns"][column], dtype="<f8").tobytes())
+
+        if not row_count:
+            raise ValueError("No data rows found.")
+        save_store_arrays(
+            TRIAL_STORE_DIR,
+            trial_id,
+            {"headers": np.array(headers, dtype=str)},
+            TRIAL_STORE_MAX_BYTES,
+            spooled=spooled,
+        )
+    return row_count
+
+
+def result_cache_key(trial_id):
+    return f"{trial_id}-{SIXDOF_EQUATIONS_HASH}"
+
+
+def evict_stale_results(directory):
+    for path in directory.glob("*.npz"):
+        if not path.stem.endswith(f"-{SIXDOF_EQUATIONS_HASH}"):
             try:
-                float(cleaned_row[column])
-            except ValueError as exc:
-                raise ValueError(f"Invalid numeric value in {column} at CSV row {row_index}.") from exc
-        rows.append(cleaned_row)
+                path.unlink()
+            except FileNotFoundError:
+                pass
+
+
+@lru_cache(maxsize=8)
+def cached_result(trial_id):
+    return load_store_arrays(RESULT_CACHE_DIR, result_cache_key(trial_id))
+
 
-    if not rows:
-        raise ValueError("No data rows found.")
+def load_cached_result(trial_id):
+    if not touch_store_entry(RESULT_CACHE_DIR, result_cache_key(trial_id)):
+        return None
+    strains = cached_result(trial_id)
+    if strains is None:
+        cached_result.cache_clear()
+    return strains
+
+
+def save_cached_result(trial_id, strains):
+    save_store_arrays(RESULT_CACHE_DIR, result_cache_key(trial_id), strains, RESULT_CACHE_MAX_BYTES)
+
+
+def store_trial_bytes(trial_id, byte_chunks, filename, max_samples=None):
+    row_count = stored_trial_row_count(trial_id)
+    if row_count is None:
+        blocks = trial_block_reader(filename)(iter_decoded_text(byte_chunks))
+        row_count = save_trial_blocks(trial_id, blocks, max_samples=max_samples)
+    elif max_samples is not None and row_count > max_samples:
+        raise ValueError(f"Upload exceeds the {MAX_UPLOAD_SAMPLES} total sample limit.")
 
     return {
         "name": filename or "uploaded_trial.csv",
-        "headers": headers,
-        "rows": rows,
-        "row_count": len(rows),
+        "trial_id": trial_id,
+        "row_count": row_count,
     }
 
 
-def converted_row(row):
-    flexion = float(row["flex"])
-    adduction = float(row["add"])
-    internal_rotation = float(row["introt"])
-    anterior_translation = float(row["ant"])
-    proximal_translation = float(row["prox"])
-    lateral_translation = float(row["lat"])
+def store_trial_sources(sources, max_samples=None):
+    files = []
+    errors = []
+    for name, open_chunks, trial_id in sources:
+        try:
+            files.append(store_trial_bytes(
+                trial_id or content_hash(open_chunks()),
+                open_chunks(),
+                name,
+                max_samples=max_samples,
+            ))
+        except ValueError as exc:
+            errors.append(f"{name}: {exc}")
+            continue
+        if max_samples is not None:
+            max_samples -= files[-1]["row_count"]
+    return files, errors
+
+
+def store_uploaded_csv(contents, filename, max_samples=None):
+    spool, trial_id = spool_byte_chunks(iter_base64_bytes(uploaded_base64(contents)))
+    with spool:
+        return store_trial_sources(iter_trial_sources(filename, spool, trial_id), max_samples=max_samples)
 
-    converted = dict(row)
-    for target in CONVERSION_OUTPUT_COLUMNS:
-        converted[target] = f"{calculate_6dof_strain(
-            target=target,
-            flexion=flexion,
-            adduction=adduction,
-            internal_rotation=internal_rotation,
-            anterior_translation=anterior_translation,
-            lateral_translation=lateral_translation,
-            proximal_translation=proximal_translation,
-        ):.6g}"
-    return converted
-
-
-def output_filename(filename):
+
+def store_uploaded_stream(stream, filename, max_samples=None):
+    spool, trial_id = spool_upload_stream(stream)
+    with spool:
+        return store_trial_sources(iter_trial_sources(filename, spool, trial_id), max_samples=max_samples)
+
+
+def load_processed_trial(file_entry):
+    trial = load_trial(file_entry["trial_id"])
+    strains = load_cached_result(file_entry["trial_id"])
+    if trial is None or strains is None:
+        return {"name": file_entry["name"], "row_count": 0}
+    return {"name": file_entry["name"], "trial_id": file_entry["trial_id"], **trial, "strains": strains}
+
+
+def convert_trial_file(trial_id, progress=None, engine=None):
+    if load_cached_result(trial_id) is not None:
+        return "cached"
+    trial = load_trial(trial_id)
+    if trial is None:
+        raise ValueError("File is no longer available. Please upload it again.")
+    strains = calculate_6dof_strain_columns(**trial_kinematic_columns(trial), engine=engine, progress=progress)
+    save_cached_result(trial_id, strains)
+    return "converted"
+
+
+@lru_cache(maxsize=1)
+def speculative_jobs():
+    return diskcache.Cache(str(CONVERSION_JOB_DIR / "speculative"))
+
+
+def speculative_job_record(job_id):
+    if not isinstance(job_id, str) or not re.fullmatch(r"[0-9a-f]{32}", job_id):
+        return None
+    return speculative_jobs().get(job_id)
+
+
+def update_speculative_job(job_id, **fields):
+    record = {**(speculative_job_record(job_id) or {}), **fields, "heartbeat": time.time()}
+    speculative_jobs().set(job_id, record, expire=SPECULATIVE_JOB_TTL_SECONDS)
+    return record
+
+
+def run_speculative_conversion(job_id, file_entries):
+    last_heartbeat = [0.0]
+
+    def heartbeat(rows):
+        if (speculative_job_record(job_id) or {}).get("cancelled"):
+            raise RuntimeError("Speculative conversion cancelled.")
+        if time.monotonic() - last_heartbeat[0] >= SPECULATIVE_HEARTBEAT_SECONDS:
+            last_heartbeat[0] = time.monotonic()
+            update_speculative_job(job_id, rows=rows)
+
+    errors = {}
+    try:
+        for file_entry in file_entries:
+            if (speculative_job_record(job_id) or {}).get("cancelled"):
+                break
+            update_speculative_job(job_id, trial_id=file_entry["trial_id"], rows=0)
+            try:
+                # This thread runs inside a web worker, which never enters the Numba kernel.
+                convert_trial_file(file_entry["trial_id"], progress=heartbeat, engine=SIXDOF_INTERACTIVE_ENGINE)
+            except Exception as exc:
+                if (speculative_job_record(job_id) or {}).get("cancelled"):
+                    break
+                # Process reports the stored error instead of converting the file again.
+                server.logger.exception("Speculative conversion of %s failed.", file_entry["name"])
+                errors[file_entry["trial_id"]] = str(exc)
+                update_speculative_job(job_id, errors=errors)
+    finally:
+        update_speculative_job(job_id, trial_id=None, done=True)
+
+
+def start_speculative_conversion(file_entries):
+    # A thread in the upload worker starts instantly and never imports the layout
+    # again; the job record lives server-side so the browser only holds an opaque id.
+    job_id = secrets.token_hex(16)
+    update_speculative_job(job_id, trial_id=None, rows=0, done=False, cancelled=False)
+    threading.Thread(
+        target=run_speculative_conversion,
+        args=(job_id, [dict(file_entry) for file_entry in file_entries]),
+        daemon=True,
+    ).start()
+    return job_id
+
+
+def active_speculative_job(job_id):
+    record = speculative_job_record(job_id)
+    if (
+        record is None
+        or record.get("done")
+        or record.get("cancelled")
+        or time.time() - record["heartbeat"] > SPECULATIVE_STALE_SECONDS
+    ):
+        return None
+    return record
+
+
+def cancel_speculative_conversion(job_id):
+    if active_speculative_job(job_id) is not None:
+        update_speculative_job(job_id, cancelled=True)
+
+
+def convert_trial_files(file_entries, progress=None, speculative_job=None):
+    trial_ids = [file_entry["trial_id"] for file_entry in file_entries]
+    row_counts = [int(file_entry["row_count"]) for file_entry in file_entries]
+    outcomes = [None] * len(trial_ids)
+    pending = []
+    completed_samples = 0
+    for index, trial_id in enumerate(trial_ids):
+        if load_cached_result(trial_id) is not None:
+            outcomes[index] = ("cached", None)
+            completed_samples += row_counts[index]
+        else:
+            pending.append(index)
+
+    def report(samples, name):
+        if progress is not None:
+            progress(samples, name)
+
+    report(completed_samples, None)
+    finished = set()
+    while pending:
+        # Attach only while the speculative job is converting one of our pending
+        # files; if it has not reached them yet, convert here and stop it instead.
+        job = active_speculative_job(speculative_job)
+        failures = (speculative_job_record(speculative_job) or {}).get("errors", {})
+        for index in list(pending):
+            result_path = store_path(RESULT_CACHE_DIR, result_cache_key(trial_ids[index]))
+            if result_path is not None and result_path.exists():
+                outcomes[index] = ("converted", None)
+            elif trial_ids[index] in failures:
+                outcomes[index] = (None, failures[trial_ids[index]])
+            else:
+                continue
+            pending.remove(index)
+            finished.add(trial_ids[index])
+            completed_samples += row_counts[index]
+            report(completed_samples, file_entries[index]["name"])
+        if job is None:
+            break
+        current = [index for index in pending if trial_ids[index] == job.get("trial_id")]
+        if current:
+            report(completed_samples + int(job.get("rows") or 0), file_entries[current[0]]["name"])
+        elif job.get("trial_id") not in finished:
+            break
+        time.sleep(SPECULATIVE_POLL_SECONDS)
+    cancel_speculative_conversion(speculative_job)
+
+    pending_samples = sum(row_counts[index] for index in pending)
+    # The Numba kernel already runs on every core and must not be entered from
+    # several threads at once, so it keeps converting one file at a time.
+    if (
+        len(pending) > 1
+        and CONVERSION_WORKERS > 1
+        and SIXDOF_STRAIN_ENGINE != "numba"
+        and pending_samples >= CONVERSION_POOL_MIN_SAMPLES
+    ):
+        converted_rows = [0] * len(trial_ids)
+
+        def convert_pending(index):
+            def track(rows):
+                converted_rows[index] = rows
+            return convert_trial_file(trial_ids[index], progress=track)
+
+        # Each background job runs in its own forked process, so the pool is
+        # created here and shut down with the job. The chunked NumPy kernels
+        # spend most of their time in ufunc loops that release the GIL.
+        with concurrent.futures.ThreadPoolExecutor(max_workers=min(CONVERSION_WORKERS, len(pending))) as pool:
+            futures = {pool.submit(convert_pending, index): index for index in pending}
+            while futures:
+                done, _ = concurrent.futures.wait(
+                    futures,
+                    timeout=SPECULATIVE_POLL_SECONDS,
+                    return_when=concurrent.futures.FIRST_COMPLETED,
+                )
+                for future in done:
+                    index = futures.pop(future)
+                    try:
+                        outcomes[index] = (future.result(), None)
+                    except Exception as exc:
+                        outcomes[index] = (None, str(exc))
+                    completed_samples += row_counts[index]
+                running = sorted(futures.values())
+                report(
+                    completed_samples + sum(converted_rows[index] for index in running),
+                    file_entries[running[0]]["name"] if running else None,
+                )
+
+    for index in pending:
+        if outcomes[index] is None:
+            name = file_entries[index]["name"]
+            try:
+                outcomes[index] = (convert_trial_file(
+                    trial_ids[index],
+                    progress=lambda rows, base=completed_samples, name=name: report(base + rows, name),
+                ), None)
+            except Exception as exc:
+                outcomes[index] = (None, str(exc))
+            completed_samples += row_counts[index]
+            report(completed_samples, name)
+    return outcomes
+
+
+def trial_column(file_info, column):
+    return np.asarray(file_info["columns"][column], dtype=float)
+
+
+def trial_kinematic_columns(file_info):
+    return {
+        parameter: trial_column(file_info, column)
+        for parameter, column in UPLOAD_KINEMATIC_COLUMNS.items()
+    }
+
+
+def trial_strain(file_info, target):
+    return np.asarray(file_info["strains"][target], dtype=float)
+
+
+def output_filename(filename, extension="csv"):
     source_name = Path(filename).name
     stem = Path(source_name).stem or "trial"
-    return f"{stem}_acl_strain.csv"
+    return f"{stem}_acl_strain.{extension}"
+
+
+def zip_member_names(file_entries, extension="csv"):
+    # Archive members keep their folders (minus the .zip suffix) so S01/trial1.csv and
+    # S02/trial1.csv stay apart; any remaining clash gets a numeric suffix.
+    names = []
+    seen = set()
+    for file_entry in file_entries:
+        folders = [
+            part[:-4] if index == 0 and part.lower().endswith(".zip") else part
+            for index, part in enumerate(Path(file_entry["name"]).parts[:-1])
+            if part not in {"", ".", "..", "/"}
+        ]
+        name = "/".join(folders + [output_filename(file_entry["name"], extension)])
+        stem, suffix = name.rsplit(".", 1)
+        count = 1
+        while name.lower() in seen:
+            count += 1
+            name = f"{stem}_{count}.{suffix}"
+        seen.add(name.lower())
+        names.append(name)
+    return names
+
+
+def g6_byte_columns(values):
+    values = np.asarray(values, dtype=np.float64).reshape(-1)
+    magnitude = np.abs(values)
+    nonzero = magnitude > 0
+    with np.errstate(all="ignore"):
+        exponent = np.floor(np.log10(np.where(nonzero, magnitude, 1.0))).astype(np.int32)
+        scaled = magnitude * 10.0 ** (5 - exponent)
+        low = scaled < 99999.5
+        exponent[low] -= 1
+        scaled[low] = magnitude[low] * 10.0 ** (5 - exponent[low])
+        fraction = scaled - np.floor(scaled)
+    fallback = ~np.isfinite(values) | (magnitude > 1e290) | (nonzero & (
+        (np.abs(fraction - 0.5) < 1e-6) | (magnitude < 1e-290)
+    ))
+    exact = nonzero & ~fallback
+    mantissa = np.where(exact, np.rint(scaled), 0).astype(np.int32)
+    carry = mantissa >= 1000000
+    mantissa[carry] = 100000
+    exponent = np.where(exact, exponent + carry, 0)
+
+    digits = np.empty((6, values.size), dtype=np.uint8)
+    for position, power in enumerate(G6_DIGIT_POWERS):
+        digits[position] = mantissa // power % 10
+    kept = np.where(exact, 6, 1)
+    for position in range(5, 0, -1):
+        kept -= (kept == position + 1) & (digits[position] == 0)
+    digits += ord("0")
+    scientific = (exponent < -4) | (exponent >= 6)
+    small = ~scientific & (exponent < 0)
+    digit_limit = np.where(scientific | small, kept, np.maximum(kept, exponent + 1))
+    exponent_abs = np.abs(exponent)
+
+    out = np.zeros((G6_SLOTS, values.size), dtype=np.uint8)
+    out[0] = np.signbit(values) * np.uint8(ord("-"))
+    out[1] = small * np.uint8(ord("0"))
+    out[2] = small * np.uint8(ord("."))
+    for zero in range(3):
+        out[3 + zero] = (small & (exponent < -1 - zero)) * np.uint8(ord("0"))
+    for position in range(6):
+        out[6 + 2 * position] = (digit_limit > position) * digits[position]
+    out[7] = ((scientific | (exponent == 0)) & (kept > 1)) * np.uint8(ord("."))
+    for position in range(1, 5):
+        out[7 + 2 * position] = (~scientific & (exponent == position) & (kept > position + 1)) * np.uint8(ord("."))
+    out[17] = scientific * np.uint8(ord("e"))
+    out[18] = scientific * np.where(exponent < 0, np.uint8(ord("-")), np.uint8(ord("+")))
+    exponent_digits = np.minimum(exponent_abs, 999).astype(np.uint16)
+    out[19] = (scientific & (exponent_abs >= 100)) * (exponent_digits // 100 + ord("0")).astype(np.uint8)
+    out[20] = scientific * (exponent_digits // 10 % 10 + ord("0")).astype(np.uint8)
+    out[21] = scientific * (exponent_digits % 10 + ord("0")).astype(np.uint8)
+
+    for index in np.flatnonzero(fallback):
+        text = np.frombuffer(f"{values[index]:.6g}".encode("ascii"), dtype=np.uint8)
+        out[:, index] = 0
+        out[:text.size, index] = text
+    return out
+
+
+def csv_block_bytes(input_lines, strain_columns):
+    block = np.zeros((len(input_lines), len(strain_columns) * (G6_SLOTS + 1) + 1), dtype=np.uint8)
+    offset = 0
+    for values in strain_columns:
+        block[:, offset] = ord(",")
+        block[:, offset + 1:offset + 1 + G6_SLOTS] = g6_byte_columns(values).T
+        offset += G6_SLOTS + 1
+    block[:, offset] = ord("\n")
+    tails = block[block != 0]
+    tail_ends = (np.flatnonzero(tails == ord("\n")) + 1).tolist()
+    tails = tails.tobytes()
+    return b"".join(
+        input_line.encode("utf-8") + tails[start:stop]
+        for input_line, start, stop in zip(input_lines, [0] + tail_ends[:-1], tail_ends)
+    )
 
 
-def csv_text_from_rows(headers, rows):
-    output = io.StringIO()
-    writer = csv.DictWriter(output, fieldnames=list(headers) + list(CONVERSION_OUTPUT_COLUMNS), lineterminator="\n")
-    writer.writeheader()
-    writer.writerows(rows)
-    return output.getvalue()
+def iter_csv_chunks(file_info, chunk_rows=UPLOAD_CHUNK_ROWS):
+    header = io.StringIO()
+    csv.writer(header, lineterminator="\n").writerow(list(file_info["headers"]) + list(CONVERSION_OUTPUT_COLUMNS))
+    yield header.getvalue().encode("utf-8")
+    strains = [trial_strain(file_info, target) for target in CONVERSION_OUTPUT_COLUMNS]
+    for start, input_lines in zip(
+        range(0, int(file_info["row_count"]), chunk_rows),
+        iter_trial_input_lines(file_info["trial_id"], chunk_rows),
+    ):
+        stop = start + chunk_rows
+        yield csv_block_bytes(input_lines, [values[start:stop] for values in strains])
+
+
+class DownloadStreamSink(io.RawIOBase):
+    def __init__(self):
+        super().__init__()
+        self.chunks = []
+
+    def writable(self):
+        return True
+
+    def write(self, data):
+        self.chunks.append(bytes(data))
+        return len(data)
+
+    def drain(self):
+        data = b"".join(self.chunks)
+        self.chunks = []
+        return data
+
+
+def iter_zip_chunks(file_entries):
+    sink = DownloadStreamSink()
+    with zipfile.ZipFile(sink, mode="w", compression=zipfile.ZIP_DEFLATED) as archive:
+        for file_entry, member_name in zip(file_entries, zip_member_names(file_entries)):
+            file_info = load_processed_trial(file_entry)
+            with archive.open(member_name, mode="w", force_zip64=True) as member:
+                for chunk in iter_csv_chunks(file_info):
+                    member.write(chunk)
+                    data = sink.drain()
+                    if data:
+                        yield data
+    yield sink.drain()
+
+
+EXPORT_COLUMN_DTYPES = {
+    **{column: "<f8" for column in REQUIRED_UPLOAD_COLUMNS},
+    # float32 keeps more than the six significant digits the CSV export writes.
+    **{target: "<f4" for target in CONVERSION_OUTPUT_COLUMNS},
+}
 
 
-def conversion_download_payload(files):
-    if len(files) == 1:
-        file_info = files[0]
-        return {
-            "content": csv_text_from_rows(file_info["headers"], file_info["output_rows"]),
-            "filename": output_filename(file_info["name"]),
-            "type": "text/csv",
-        }
+def export_table_columns(file_info):
+    return {
+        **{column: trial_column(file_info, column) for column in REQUIRED_UPLOAD_COLUMNS},
+        **{target: trial_strain(file_info, target) for target in CONVERSION_OUTPUT_COLUMNS},
+    }
+
 
-    zip_buffer = io.BytesIO()
-    with zipfile.ZipFile(zip_buffer, mode="w", compression=zipfile.ZIP_DEFLATED) as archive:
-        for file_info in files:
-            archive.writestr(
-                output_filename(file_info["name"]),
-                csv_text_from_rows(file_info["headers"], file_info["output_rows"]),
+def iter_parquet_chunks(file_entries):
+    schema = pyarrow.schema(
+        [("trial", pyarrow.dictionary(pyarrow.int32(), pyarrow.string()))]
+        + [(column, pyarrow.from_numpy_dtype(np.dtype(dtype))) for column, dtype in EXPORT_COLUMN_DTYPES.items()]
+    )
+    sink = DownloadStreamSink()
+    with pyarrow.parquet.ParquetWriter(
+        sink,
+        schema,
+        compression="zstd",
+        use_dictionary=["trial"],
+        # Uploaded kinematics come from decimal text and compress better unsplit.
+        use_byte_stream_split=list(CONVERSION_OUTPUT_COLUMNS),
+    ) as writer:
+        for file_entry in file_entries:
+            file_info = load_processed_trial(file_entry)
+            trial_names = pyarrow.DictionaryArray.from_arrays(
+                np.zeros(file_info["row_count"], dtype=np.int32),
+                pyarrow.array([file_info["name"]]),
             )
+            writer.write_table(pyarrow.table(
+                {
+                    "trial": trial_names,
+                    **{
+                        column: np.asarray(values, dtype=EXPORT_COLUMN_DTYPES[column])
+                        for column, values in export_table_columns(file_info).items()
+                    },
+                },
+                schema=schema,
+            ))
+            yield sink.drain()
+    yield sink.drain()
 
-    return {
-        "content": base64.b64encode(zip_buffer.getvalue()).decode("ascii"),
-        "filename": "acl_strain_outputs.zip",
-        "type": "application/zip",
-        "base64": True,
-    }
+
+def write_npy_header(handle, dtype, length):
+    np.lib.format.write_array_header_1_0(handle, {
+        "descr": np.lib.format.dtype_to_descr(np.dtype(dtype)),
+        "fortran_order": False,
+        "shape": (length,),
+    })
+
+
+def iter_npz_chunks(file_entries):
+    trial_names = np.array([file_entry["name"] for file_entry in file_entries], dtype=str)
+    with contextlib.ExitStack() as stack:
+        # Each .npy member spans every trial, so load each trial once and spool
+        # its columns instead of reloading it for every member.
+        spools = {column: stack.enter_context(tempfile.TemporaryFile()) for column in EXPORT_COLUMN_DTYPES}
+        row_counts = []
+        for file_entry in file_entries:
+            file_info = load_processed_trial(file_entry)
+            row_counts.append(file_info["row_count"])
+            for column, values in export_table_columns(file_info).items():
+                spools[column].write(np.asarray(values, dtype=EXPORT_COLUMN_DTYPES[column]).tobytes())
+
+        sink = DownloadStreamSink()
+        with zipfile.ZipFile(sink, mode="w", compression=zipfile.ZIP_DEFLATED) as archive:
+            with archive.open("trial_names.npy", mode="w") as member:
+                np.lib.format.write_array(member, trial_names, allow_pickle=False)
+            with archive.open("trial.npy", mode="w", force_zip64=True) as member:
+                write_npy_header(member, "<i4", sum(row_counts))
+                for index, row_count in enumerate(row_counts):
+                    member.write(np.full(row_count, index, dtype="<i4").tobytes())
+            yield sink.drain()
+            for column, dtype in EXPORT_COLUMN_DTYPES.items():
+                spools[column].seek(0)
+                with archive.open(f"{column}.npy", mode="w", force_zip64=True) as member:
+                    write_npy_header(member, dtype, sum(row_counts))
+                    for chunk in iter_file_bytes(spools[column]):
+                        member.write(chunk)
+                        yield sink.drain()
+        yield sink.drain()
+
+
+@lru_cache(maxsize=1)
+def download_batches():
+    return diskcache.Cache(str(CONVERSION_JOB_DIR / "downloads"))
+
+
+def register_download_batch(file_entries):
+    # Batches live server-side so the href stays short however many trials it covers.
+    entries = [{"trial_id": file_entry["trial_id"], "name": file_entry["name"]} for file_entry in file_entries]
+    token = hashlib.sha256(json.dumps(entries).encode("utf-8")).hexdigest()[:32]
+    download_batches().set(token, entries, expire=DOWNLOAD_BATCH_TTL_SECONDS)
+    return token
+
+
+def download_batch_entries(token):
+    if not DOWNLOAD_TOKEN_PATTERN.fullmatch(token or ""):
+        return []
+    return download_batches().get(token) or []
+
+
+def conversion_download_href(file_entries, download_format="csv"):
+    return app.get_relative_path(DOWNLOAD_ROUTE) + "?" + urlencode([
+        ("format", download_format),
+        ("batch", register_download_batch(file_entries)),
+    ])
 
 
 def numeric_row_value(row, column, default=0):
@@ -383,7 +1945,7 @@ def numeric_row_value(row, column, default=0):
 
 
 def clamp_frame_index(file_info, frame_index):
-    row_count = len(file_info.get("output_rows", []))
+    row_count = int(file_info.get("row_count", 0))
     if row_count <= 0:
         return 0
     return max(0, min(int(frame_index or 0), row_count - 1))
@@ -417,20 +1979,85 @@ def conversion_panel_loader(label):
     ], className="conversion-panel-loader-inner")
 
 
+def trace_time_axis(times):
+    if len(times) > 1:
+        dx = (float(times[-1]) - float(times[0])) / (len(times) - 1)
+        steps = float(times[0]) + dx * np.arange(len(times))
+        if dx > 0 and float(np.max(np.abs(times - steps))) <= TRACE_TIME_TOLERANCE * dx:
+            return {"x0": float(times[0]), "dx": dx}
+    # Time stays float64: float32 steps are about 8 ms by t = 1e5 s.
+    return {"x": times.astype(np.float64)}
+
+
+def minmax_decimation_indices(values, max_points):
+    count = values.shape[1]
+    if count <= max_points:
+        return np.broadcast_to(np.arange(count), values.shape)
+    width = -(-count // max(max_points // 2 - 1, 1))
+    buckets = -(-count // width)
+    padded = np.pad(values, ((0, 0), (0, buckets * width - count)), mode="edge").reshape(len(values), buckets, width)
+    offsets = np.arange(buckets) * width
+    return np.sort(np.concatenate([
+        np.zeros((len(values), 1), dtype=np.int64),
+        np.minimum(padded.argmin(axis=2) + offsets, count - 1),
+        np.minimum(padded.argmax(axis=2) + offsets, count - 1),
+        np.full((len(values), 1), count - 1, dtype=np.int64),
+    ], axis=1), axis=1)
+
+
+@lru_cache(maxsize=32)
+def decimated_strain_traces(trial_id, start, stop):
+    trial = load_trial(trial_id)
+    strains = load_cached_result(trial_id)
+    times = trial["columns"]["time"][start:stop]
+    values = np.stack([strains[target][start:stop] for target in CONVERSION_OUTPUT_COLUMNS])
+    return [
+        {"x": times[indices].astype(np.float64), "y": row[indices].astype(np.float32)}
+        for row, indices in zip(values, minmax_decimation_indices(values, STRAIN_GRAPH_MAX_POINTS))
+    ]
+
+
+def strain_window_traces(file_info, start, stop):
+    if stop - start > STRAIN_GRAPH_MAX_POINTS:
+        return decimated_strain_traces(file_info["trial_id"], start, stop)
+    times = trial_column(file_info, "time")[start:stop].astype(np.float64)
+    return [
+        {"x": times, "y": trial_strain(file_info, target)[start:stop].astype(np.float32)}
+        for target in CONVERSION_OUTPUT_COLUMNS
+    ]
+
+
+def strain_window_bounds(file_info, x_range):
+    row_count = int(file_info.get("row_count", 0))
+    if x_range is None or not file_info.get("time_sorted"):
+        return 0, row_count
+    times = trial_column(file_info, "time")
+    low, high = sorted(float(value) for value in x_range)
+    start = max(int(np.searchsorted(times, low)) - 1, 0)
+    stop = min(int(np.searchsorted(times, high, side="right")) + 1, row_count)
+    return start, max(stop, start + 1)
+
+
 def make_conversion_strain_figure(file_info, frame_index):
-    output_rows = file_info.get("output_rows", [])
-    if not output_rows:
+    if not file_info.get("strains"):
         return make_empty_conversion_figure("Processed strain traces will appear here.")
 
     frame_index = clamp_frame_index(file_info, frame_index)
-    times = [numeric_row_value(row, "time", index) for index, row in enumerate(output_rows)]
+    times = trial_column(file_info, "time")
+    if len(times) > STRAIN_GRAPH_MAX_POINTS:
+        traces = decimated_strain_traces(file_info["trial_id"], 0, len(times))
+    else:
+        time_axis = trace_time_axis(times)
+        traces = [
+            {**time_axis, "y": trial_strain(file_info, target).astype(np.float32)}
+            for target in CONVERSION_OUTPUT_COLUMNS
+        ]
 
     fig = go.Figure()
-    for target in CONVERSION_OUTPUT_COLUMNS:
+    for target, trace in zip(CONVERSION_OUTPUT_COLUMNS, traces):
         is_bundle = target in ("ACLam", "ACLpl")
-        fig.add_trace(go.Scatter(
-            x=times,
-            y=[numeric_row_value(row, target) for row in output_rows],
+        fig.add_trace(go.Scattergl(
+            **trace,
             mode="lines",
             name=target,
             line=dict(
@@ -444,14 +2071,25 @@ def make_conversion_strain_figure(file_info, frame_index):
 
     fig.add_shape(
         type="line",
-        x0=min(times),
-        x1=max(times),
+        x0=float(np.min(times)),
+        x1=float(np.max(times)),
         y0=0,
         y1=0,
         xref="x",
         yref="y",
         line=dict(color="rgba(0, 0, 0, 0.72)", width=3),
     )
+    fig.add_shape(
+        type="line",
+        x0=row_time(file_info, frame_index),
+        x1=row_time(file_info, frame_index),
+        y0=0,
+        y1=1,
+        xref="x",
+        yref="paper",
+        line=dict(color=PLAYHEAD_COLOR, width=2),
+        name="playhead",
+    )
     fig.update_layout(
         margin=dict(l=46, r=16, t=18, b=44),
         paper_bgcolor="#ffffff",
@@ -466,12 +2104,11 @@ def make_conversion_strain_figure(file_info, frame_index):
 
 
 def make_conversion_value_table(file_info, frame_index):
-    output_rows = file_info.get("output_rows", [])
-    if not output_rows:
+    if not file_info.get("strains"):
         return html.Div("No processed values yet.", className="conversion-status-text")
 
     frame_index = clamp_frame_index(file_info, frame_index)
-    row = output_rows[frame_index]
+    strains = file_info["strains"]
     return html.Table([
         html.Tbody([
             html.Tr([
@@ -493,20 +2130,54 @@ def make_conversion_value_table(file_info, frame_index):
             ]),
             html.Tr([
                 html.Th("Strain (%)"),
-                *[html.Td(f"{numeric_row_value(row, target):+.2f}") for target in CONVERSION_OUTPUT_COLUMNS],
+                *[html.Td(f"{float(strains[target][frame_index]):+.2f}") for target in CONVERSION_OUTPUT_COLUMNS],
             ]),
         ]),
-    ], className="conversion-value-table")
+    ], className="conversion-value-table", **{"data-frame": str(frame_index)})
+
+
+def conversion_playhead_patch(file_info, frame_index):
+    playhead_time = row_time(file_info, frame_index)
+    patch = Patch()
+    patch["layout"]["shapes"][PLAYHEAD_SHAPE_INDEX]["x0"] = playhead_time
+    patch["layout"]["shapes"][PLAYHEAD_SHAPE_INDEX]["x1"] = playhead_time
+    return patch
+
+
+def conversion_value_table_patch(file_info, frame_index):
+    frame_index = clamp_frame_index(file_info, frame_index)
+    patch = Patch()
+    patch["props"]["data-frame"] = str(frame_index)
+    value_cells = patch["props"]["children"][0]["props"]["children"][1]["props"]["children"]
+    for column, target in enumerate(CONVERSION_OUTPUT_COLUMNS, start=1):
+        value_cells[column]["props"]["children"] = f"{float(file_info['strains'][target][frame_index]):+.2f}"
+    return patch
 
 
-def kinematics_from_converted_row(row):
+def typed_array(values, dtype):
     return {
-        "flexion": numeric_row_value(row, "flex"),
-        "adduction": numeric_row_value(row, "add"),
-        "internal_rotation": numeric_row_value(row, "introt"),
-        "anterior_translation": numeric_row_value(row, "ant"),
-        "proximal_translation": numeric_row_value(row, "prox"),
-        "lateral_translation": numeric_row_value(row, "lat"),
+        "dtype": dtype,
+        "bdata": base64.b64encode(np.ascontiguousarray(values, dtype=f"<{dtype}").tobytes()).decode("ascii"),
+    }
+
+
+def conversion_trace_data(file_info, file_index):
+    if not file_info.get("strains"):
+        return None
+    # Every stride-th row (plus the last) is plenty for a player that redraws at
+    # screen rate, and keeps the trace a few MB however long the trial is.
+    row_count = int(file_info["row_count"])
+    stride = max(1, -(-row_count // PLAYBACK_TRACE_MAX_SAMPLES))
+    rows = np.arange(0, row_count, stride)
+    if rows[-1] != row_count - 1:
+        rows = np.append(rows, row_count - 1)
+    return {
+        "trial_id": file_info.get("trial_id"),
+        "file_index": file_index,
+        "stride": stride,
+        "row_count": row_count,
+        "time": typed_array(trial_column(file_info, "time")[rows], "f8"),
+        "strains": [typed_array(trial_strain(file_info, target)[rows], "f4") for target in CONVERSION_OUTPUT_COLUMNS],
     }
 
 
@@ -516,23 +2187,26 @@ def selected_conversion_file(result_data, playback_data):
         return None, 0
     file_index = int((playback_data or {}).get("file_index", 0))
     file_index = max(0, min(file_index, len(files) - 1))
-    return files[file_index], file_index
+    return load_processed_trial(files[file_index]), file_index
 
 
 def nearest_time_index(file_info, clicked_time):
-    rows = file_info.get("output_rows", [])
-    if not rows:
+    if not file_info.get("row_count"):
         return 0
-    times = [numeric_row_value(row, "time", index) for index, row in enumerate(rows)]
-    return min(range(len(times)), key=lambda index: abs(times[index] - clicked_time))
+    times = trial_column(file_info, "time")
+    if not file_info.get("time_sorted"):
+        return int(np.argmin(np.abs(times - clicked_time)))
+    index = int(np.searchsorted(times, clicked_time))
+    if index >= len(times) or (index > 0 and clicked_time - times[index - 1] <= times[index] - clicked_time):
+        return int(np.searchsorted(times, times[index - 1]))
+    return index
 
 
 def row_time(file_info, frame_index):
-    rows = file_info.get("output_rows", [])
-    if not rows:
+    if not file_info.get("row_count"):
         return 0.0
     frame_index = clamp_frame_index(file_info, frame_index)
-    return numeric_row_value(rows[frame_index], "time", frame_index)
+    return float(file_info["columns"]["time"][frame_index])
 
 
 @lru_cache(maxsize=512)
@@ -768,7 +2442,8 @@ def make_data_conversion_tab():
         html.Section([
             html.P(
                 "Please upload one or more 6DOF knee kinematic trial files as CSV files "
-                "using the column format below.",
+                "(or .zip / .csv.gz archives of them) using the column format below. OpenSim "
+                ".mot and .sto files are also accepted and read from the right knee coordinates.",
                 className="conversion-instructions",
             ),
             dcc.Upload(
@@ -778,18 +2453,27 @@ def make_data_conversion_tab():
                     html.Div("or click to select files", className="upload-secondary-text"),
                 ]),
                 multiple=True,
-                accept=".csv,text/csv",
+                accept=".csv,text/csv,.mot,.sto,.zip,application/zip,.gz,application/gzip",
                 className="kinematic-upload-box",
             ),
+            html.Div(id="upload-progress", className="conversion-status-text upload-progress"),
             html.Div(id="upload-summary", className="conversion-status-text"),
             html.Div([
                 html.Button("Process", id="process-kinematics", n_clicks=0, disabled=True, className="conversion-action-button"),
-                html.Button("Download", id="download-conversion-output", n_clicks=0, disabled=True, className="conversion-action-button"),
+                dcc.Dropdown(
+                    id="download-format",
+                    options=DOWNLOAD_FORMAT_OPTIONS,
+                    value="csv",
+                    clearable=False,
+                    searchable=False,
+                    style={"fontSize": "13px", "width": "110px"},
+                ),
+                html.A("Download", id="download-conversion-output", className="conversion-action-button is-disabled"),
+                html.Button("Cancel", id="cancel-conversion", n_clicks=0, disabled=True, className="conversion-action-button"),
             ], className="conversion-actions"),
             html.Progress(id="conversion-progress", value=0, max=1, className="conversion-progress"),
             html.Div(id="conversion-progress-label", className="conversion-progress-label"),
             html.Div(id="conversion-status", className="conversion-status-text"),
-            dcc.Download(id="conversion-download"),
             html.Div("Required CSV Format", className="conversion-subhead"),
             html.Table([
                 html.Thead(html.Tr([
@@ -848,6 +2532,7 @@ def make_data_conversion_tab():
                         style={"width": "100%", "height": "56vh", "minHeight": "420px"},
                         config=CONVERSION_GRAPH_CONFIG,
                     ),
+                    html.Div(id="conversion-playback-readout", className="conversion-value-table-wrap conversion-playback-readout"),
                     html.Div(id="conversion-value-table", className="conversion-value-table-wrap"),
                 ], className="conversion-graph-panel", style={
                     "display": "flex",
@@ -1077,6 +2762,13 @@ def display_coordinates(x_values, y_values, z_values):
     return x_values, -z_values, y_values
 
 
+def display_rigid_transform(transform, translation):
+    rotation = ANATOMY_DISPLAY_AXES @ transform @ ANATOMY_DISPLAY_AXES.T
+    center = ANATOMY_DISPLAY_AXES @ KNEE_JOINT_CENTER
+    offset = center + ANATOMY_DISPLAY_AXES @ translation - rotation @ center
+    return {"rotation": rotation.tolist(), "offset": offset.tolist()}
+
+
 def mesh_trace(name, mesh, transform=None, translation=None):
     if transform is None:
         x_values = mesh["x"]
@@ -1362,24 +3054,17 @@ def make_fiber_panel_figure(
         lateral_translation,
         proximal_translation,
     )
-    modeled_strains = calculate_6dof_individual_fiber_strains(
+    modeled_strains = calculate_6dof_strain_columns(
         flexion=flexion,
         adduction=adduction,
         internal_rotation=internal_rotation,
         anterior_translation=anterior_translation,
         lateral_translation=lateral_translation,
         proximal_translation=proximal_translation,
+        engine=SIXDOF_INTERACTIVE_ENGINE,
     )
     bundle_mean_strains = {
-        bundle_name: float(calculate_6dof_strain(
-            target=bundle_name,
-            flexion=flexion,
-            adduction=adduction,
-            internal_rotation=internal_rotation,
-            anterior_translation=anterior_translation,
-            lateral_translation=lateral_translation,
-            proximal_translation=proximal_translation,
-        ))
+        bundle_name: float(modeled_strains[bundle_name])
         for bundle_name in ("ACLpl", "ACLam")
     }
 
@@ -1455,13 +3140,50 @@ def make_anatomy_figure(
     return fig
 
 
-app = dash.Dash(__name__, title="ACL Strain Tool")
+def make_anatomy_pose(
+    flexion,
+    adduction,
+    internal_rotation,
+    anterior_translation,
+    lateral_translation,
+    proximal_translation,
+):
+    femur_transform, femur_translation, tibia_transform, tibia_translation = knee_transforms(
+        flexion,
+        adduction,
+        internal_rotation,
+        anterior_translation,
+        lateral_translation,
+        proximal_translation,
+    )
+    femur_pose = display_rigid_transform(femur_transform, femur_translation)
+    tibia_pose = display_rigid_transform(tibia_transform, tibia_translation)
+    fibers = transformed_acl_fibers(
+        femur_transform,
+        femur_translation,
+        tibia_transform,
+        tibia_translation,
+    )
+    return {
+        "meshes": [femur_pose, tibia_pose, tibia_pose],
+        "fibers": [
+            [values.tolist() for values in display_coordinates(*np.array(fiber["points"]).T)]
+            for fiber in fibers
+        ],
+    }
+
+
+app = dash.Dash(
+    __name__,
+    title="ACL Strain Tool",
+    background_callback_manager=DiskcacheManager(diskcache.Cache(str(CONVERSION_JOB_DIR))),
+)
 server = app.server
 
 app.layout = html.Div([
     make_page_header(),
     dcc.Store(id="camera-store", data=None),
-    dcc.Store(id="anatomy-camera-store", data=None),
+    dcc.Store(id="anatomy-pose-store", data=None),
     dcc.Store(id="surface-selection-store", data=SURFACE_SELECTION_DEFAULT),
     dcc.Store(id="translation-store", data={
         "anterior": 0,
@@ -1474,12 +3196,17 @@ app.layout = html.Div([
         "frame_index": 0,
         "playing": False,
         "speed": 1.0,
-        "speed_accumulator": 0.0,
+        "client_frame_pending": False,
     }),
-    dcc.Interval(id="conversion-playback-interval", interval=PLAYBACK_INTERVAL_MS, n_intervals=0, disabled=True),
+    dcc.Store(id="conversion-trace-store", data=None),
+    dcc.Store(id="conversion-figure-file", data=None),
+    dcc.Store(id="conversion-strain-window", data=None),
+    dcc.Store(id="conversion-playback-clock", data=None),
     dcc.Input(id="translation-input", value="0,0", type="text", className="pad-sync-input"),
     dcc.Input(id="rotation-input", value="0,0", type="text", className="pad-sync-input"),
     dcc.Input(id="conversion-scrub-time", value="", type="text", className="pad-sync-input"),
+    dcc.Input(id="conversion-client-frame", value="", type="text", className="pad-sync-input"),
+    dcc.Input(id="uploaded-trial-handles", value="", type="text", className="pad-sync-input"),
     html.Div([
         dcc.Loading(
             id="model-loading",
@@ -1579,6 +3306,7 @@ app.layout = html.Div([
             html.Div([
                 dcc.Graph(
                     id="anatomy-plot",
+                    figure=make_anatomy_figure(0, 0, 0, 0, 0, 0, ANTERIOR_ANATOMY_CAMERA),
                     style={
                         "width": "100%",
                         "height": "calc(60vh + 52px)",
@@ -1762,29 +3490,95 @@ app.layout = html.Div([
 ], className="app-root")
 
 
-@app.callback(
-    Output("conversion-upload-store", "data"),
-    Output("upload-summary", "children"),
-    Input("kinematic-upload", "contents"),
-    State("kinematic-upload", "filename"),
-)
-def load_conversion_uploads(contents, filenames):
-    if not contents:
-        return None, "No CSV files selected."
+def upload_contents_hash(contents):
+    digest = hashlib.sha1()
+    for index, content in enumerate(contents):
+        if index:
+            digest.update(b"|")
+        digest.update(content.encode("utf-8"))
+    return digest.hexdigest()
 
-    if isinstance(contents, str):
-        contents = [contents]
-    if isinstance(filenames, str) or filenames is None:
-        filenames = [filenames]
 
+def stored_upload_handles(handles_json):
+    handles = json.loads(handles_json)
     parsed_files = []
+    errors = list(handles.get("errors", []))
+    # Each file arrives in its own request, so the sample limit for the whole
+    # upload can only be applied here.
+    remaining_samples = MAX_UPLOAD_SAMPLES
+    for handle in handles.get("files", []):
+        name = handle.get("name") or "uploaded_trial.csv"
+        trial_id = str(handle.get("trial_id", ""))
+        row_count = stored_trial_row_count(trial_id)
+        if row_count is None:
+            errors.append(f"{name}: File is no longer available. Please upload it again.")
+            continue
+        if row_count > remaining_samples:
+            errors.append(f"{name}: Upload exceeds the {MAX_UPLOAD_SAMPLES} total sample limit.")
+            continue
+        remaining_samples -= row_count
+        parsed_files.append({"name": name, "trial_id": trial_id, "row_count": row_count})
+    return parsed_files, errors
+
+
+@server.route(UPLOAD_ROUTE, methods=["POST"])
+def upload_trial_files():
+    if flask.request.files:
+        sources = [(storage.stream, storage.filename) for storage in flask.request.files.getlist("files")]
+    else:
+        sources = [(flask.request.stream, flask.request.args.get("name"))]
+
+    files = []
     errors = []
-    for content, filename in zip(contents, filenames):
+    for stream, filename in sources:
         try:
-            parsed_files.append(parse_uploaded_csv(content, filename))
+            stored_files, stored_errors = store_uploaded_stream(stream, filename, max_samples=MAX_UPLOAD_SAMPLES)
         except ValueError as exc:
             errors.append(f"{filename or 'Uploaded file'}: {exc}")
+            continue
+        files.extend(stored_files)
+        errors.extend(stored_errors)
+    return flask.jsonify({"files": files, "errors": errors})
 
+
+@app.callback(
+    Output("conversion-upload-store", "data"),
+    Output("upload-summary", "children"),
+    Input("kinematic-upload", "contents"),
+    Input("uploaded-trial-handles", "value"),
+    State("kinematic-upload", "filename"),
+    State("conversion-upload-store", "data"),
+)
+def load_conversion_uploads(contents, handles_json=None, filenames=None, previous_upload=None):
+    cancel_speculative_conversion((previous_upload or {}).get("speculative_job"))
+    trigger = callback_context.triggered[0]["prop_id"] if callback_context.triggered else ""
+    if trigger == "uploaded-trial-handles.value" and handles_json:
+        parsed_files, errors = stored_upload_handles(handles_json)
+        upload_id = upload_contents_hash([file_info["trial_id"] for file_info in parsed_files])
+    elif not contents:
+        return None, "No CSV files selected."
+    else:
+        if isinstance(contents, str):
+            contents = [contents]
+        if isinstance(filenames, str) or filenames is None:
+            filenames = [filenames]
+
+        parsed_files = []
+        errors = []
+        remaining_samples = MAX_UPLOAD_SAMPLES
+        for content, filename in zip(contents, filenames):
+            try:
+                stored_files, stored_errors = store_uploaded_csv(content, filename, max_samples=remaining_samples)
+            except ValueError as exc:
+                errors.append(f"{filename or 'Uploaded file'}: {exc}")
+                continue
+            parsed_files.extend(stored_files)
+            errors.extend(stored_errors)
+            remaining_samples -= sum(file_info["row_count"] for file_info in stored_files)
+        upload_id = upload_contents_hash(contents)
+
+    if not parsed_files and not errors:
+        return None, "No CSV files selected."
     if errors:
         return None, html.Div([
             html.Div("Upload error:", style={"fontWeight": "700"}),
@@ -1803,77 +3597,139 @@ def load_conversion_uploads(contents, filenames):
     return {
         "files": parsed_files,
         "total_samples": total_samples,
-        "upload_id": hashlib.sha1("|".join(contents).encode("utf-8")).hexdigest(),
+        "upload_id": upload_id,
+        "speculative_job": start_speculative_conversion(parsed_files) if SPECULATIVE_CONVERSION else None,
     }, f"{len(parsed_files)} {file_word} ready, {total_samples} total {sample_word}."
 
 
+def conversion_progress_label(samples, total_samples, name=None):
+    label = f"{samples} / {total_samples} samples"
+    return f"{label} ({name})" if name and samples < total_samples else label
+
+
 @app.callback(
-    Output("conversion-progress", "value"),
-    Output("conversion-progress", "max"),
-    Output("conversion-progress-label", "children"),
     Output("conversion-status", "children"),
     Output("conversion-result-store", "data"),
     Input("process-kinematics", "n_clicks"),
     State("conversion-upload-store", "data"),
+    background=True,
+    interval=CONVERSION_POLL_INTERVAL_MS,
+    progress=[
+        Output("conversion-progress", "value"),
+        Output("conversion-progress", "max"),
+        Output("conversion-progress-label", "children"),
+    ],
+    running=[
+        (Output("cancel-conversion", "disabled"), False, True),
+    ],
+    cancel=[Input("cancel-conversion", "n_clicks")],
     prevent_initial_call=True,
 )
-def run_conversion(process_clicks, upload_data):
+def run_conversion(set_progress, process_clicks, upload_data):
     if not upload_data or not upload_data.get("files"):
-        return 0, 1, "", "Upload one or more valid CSV files before processing.", no_update
+        set_progress((0, 1, ""))
+        return "Upload one or more valid CSV files before processing.", no_update
 
     processed_files = []
+    errors = []
     total_samples = int(upload_data["total_samples"])
     processed_samples = 0
-    for file_info in upload_data["files"]:
-        output_rows = [converted_row(row) for row in file_info["rows"]]
-        processed_samples += len(output_rows)
-        processed_files.append({
-            "name": file_info["name"],
-            "headers": file_info["headers"],
-            "rows": file_info["rows"],
-            "output_rows": output_rows,
-        })
+    cached_files = 0
+    evict_stale_results(RESULT_CACHE_DIR)
+    outcomes = convert_trial_files(
+        upload_data["files"],
+        progress=lambda samples, name: set_progress((
+            samples,
+            max(total_samples, 1),
+            conversion_progress_label(samples, total_samples, name),
+        )),
+        speculative_job=upload_data.get("speculative_job"),
+    )
+    for file_entry, (outcome, error) in zip(upload_data["files"], outcomes):
+        if error:
+            errors.append(f"{file_entry['name']}: {error}")
+            continue
+        cached_files += outcome == "cached"
+        processed_samples += int(file_entry["row_count"])
+        processed_files.append(dict(file_entry))
+
+    error_list = html.Div([
+        html.Div("Conversion error:", style={"fontWeight": "700"}),
+        html.Ul([html.Li(error) for error in errors]),
+    ]) if errors else ""
+    if not processed_files:
+        set_progress((0, 1, ""))
+        return error_list, no_update
 
     result_data = {
         "files": processed_files,
         "upload_id": upload_data.get("upload_id"),
     }
+    set_progress((processed_samples, max(total_samples, 1), conversion_progress_label(processed_samples, total_samples)))
     return (
-        processed_samples,
-        max(total_samples, 1),
-        f"{processed_samples} / {total_samples} samples",
-        "Processing complete! Results are ready to view and download.",
+        html.Div([
+            "Processing complete! Results are ready to view and download."
+            + (f" {cached_files} of {len(processed_files)} files reused from cache." if cached_files else ""),
+            error_list,
+        ]),
         result_data,
     )
 
 
 @app.callback(
     Output("process-kinematics", "disabled"),
-    Output("download-conversion-output", "disabled"),
+    Output("download-conversion-output", "href"),
+    Output("download-conversion-output", "className"),
     Input("conversion-upload-store", "data"),
     Input("conversion-result-store", "data"),
+    Input("download-format", "value"),
 )
-def update_conversion_action_buttons(upload_data, result_data):
+def update_conversion_action_buttons(upload_data, result_data, download_format="csv"):
     upload_id = (upload_data or {}).get("upload_id")
     result_id = (result_data or {}).get("upload_id")
     has_upload = bool(upload_data and upload_data.get("files"))
     has_result = bool(result_data and result_data.get("files"))
     result_matches_upload = has_result and (not has_upload or upload_id == result_id)
     process_disabled = not has_upload or result_matches_upload
-    download_disabled = not result_matches_upload
-    return process_disabled, download_disabled
-
-
-@app.callback(
-    Output("conversion-download", "data"),
-    Input("download-conversion-output", "n_clicks"),
-    State("conversion-result-store", "data"),
-    prevent_initial_call=True,
-)
-def download_conversion_output(download_clicks, result_data):
-    if not download_clicks or not result_data or not result_data.get("files"):
-        return no_update
-    return conversion_download_payload(result_data["files"])
+    if not result_matches_upload:
+        return process_disabled, None, "conversion-action-button is-disabled"
+    return process_disabled, conversion_download_href(result_data["files"], download_format), "conversion-action-button"
+
+
+@server.route(DOWNLOAD_ROUTE)
+def download_conversion_output():
+    file_entries = download_batch_entries(flask.request.args.get("batch"))
+    available = all(
+        touch_store_entry(TRIAL_STORE_DIR, file_entry.get("trial_id"))
+        and touch_store_entry(RESULT_CACHE_DIR, result_cache_key(file_entry["trial_id"]))
+        for file_entry in file_entries
+    )
+    download_format = flask.request.args.get("format", "csv")
+    if download_format == "parquet" and pyarrow is None:
+        flask.abort(404)
+    if not file_entries or not available or download_format not in DOWNLOAD_MIMETYPES:
+        flask.abort(404)
+
+    mimetype = DOWNLOAD_MIMETYPES[download_format]
+    if len(file_entries) == 1:
+        filename = output_filename(file_entries[0]["name"], download_format)
+    else:
+        filename = f"{DOWNLOAD_BATCH_STEM}.{download_format}"
+    if download_format == "parquet":
+        body = iter_parquet_chunks(file_entries)
+    elif download_format == "npz":
+        body = iter_npz_chunks(file_entries)
+    elif len(file_entries) == 1:
+        body = iter_csv_chunks(load_processed_trial(file_entries[0]))
+    else:
+        filename = DOWNLOAD_ZIP_FILENAME
+        body = iter_zip_chunks(file_entries)
+        mimetype = "application/zip"
+    return flask.Response(
+        body,
+        mimetype=mimetype,
+        headers={"Content-Disposition": f"attachment; filename*=UTF-8''{quote(filename)}"},
+    )
 
 
 @app.callback(
@@ -1892,11 +3748,57 @@ def update_playback_button_state(playback_data):
 
 
 @app.callback(
-    Output("conversion-playback-interval", "disabled"),
+    Output("conversion-trace-store", "data"),
+    Input("conversion-result-store", "data"),
+    Input("conversion-playback-store", "data"),
+    State("conversion-trace-store", "data"),
+)
+def update_conversion_trace_store(result_data, playback_data, trace_data):
+    file_info, file_index = selected_conversion_file(result_data, playback_data)
+    if not file_info:
+        return None
+    if trace_data and (trace_data.get("trial_id"), trace_data.get("file_index")) == (file_info.get("trial_id"), file_index):
+        return no_update
+    # The trace is only needed by the browser player, so it is sent when Play is pressed.
+    if not (playback_data or {}).get("playing"):
+        return None if trace_data else no_update
+    return conversion_trace_data(file_info, file_index)
+
+
+app.clientside_callback(
+    ClientsideFunction(namespace="aclPlayback", function_name="strainWindow"),
+    Output("conversion-strain-window", "data"),
+    Input("conversion-strain-graph", "relayoutData"),
+    prevent_initial_call=True,
+)
+
+
+@app.callback(
+    Output("conversion-strain-graph", "figure", allow_duplicate=True),
+    Input("conversion-strain-window", "data"),
+    State("conversion-result-store", "data"),
+    State("conversion-playback-store", "data"),
+    prevent_initial_call=True,
+)
+def update_conversion_strain_window(window_data, result_data, playback_data):
+    file_info, file_index = selected_conversion_file(result_data, playback_data)
+    if not file_info or not file_info.get("strains") or file_info["row_count"] <= STRAIN_GRAPH_MAX_POINTS:
+        return no_update
+
+    start, stop = strain_window_bounds(file_info, (window_data or {}).get("range"))
+    patch = Patch()
+    for index, trace in enumerate(strain_window_traces(file_info, start, stop)):
+        patch["data"][index]["x"] = typed_array(trace["x"], "f8")
+        patch["data"][index]["y"] = typed_array(trace["y"], "f4")
+    return patch
+
+
+app.clientside_callback(
+    ClientsideFunction(namespace="aclPlayback", function_name="syncPlayback"),
+    Output("conversion-playback-clock", "data"),
+    Input("conversion-trace-store", "data"),
     Input("conversion-playback-store", "data"),
 )
-def update_conversion_interval_state(playback_data):
-    return not bool((playback_data or {}).get("playing"))
 
 
 @app.callback(
@@ -1909,7 +3811,7 @@ def update_conversion_interval_state(playback_data):
     Input("conversion-next-frame", "n_clicks"),
     Input("conversion-strain-graph", "clickData"),
     Input("conversion-scrub-time", "value"),
-    Input("conversion-playback-interval", "n_intervals"),
+    Input("conversion-client-frame", "value"),
     Input({"type": "conversion-file-tab", "index": ALL}, "n_clicks"),
     Input({"type": "conversion-speed-button", "speed": ALL}, "n_clicks"),
     State("conversion-playback-store", "data"),
@@ -1923,7 +3825,7 @@ def update_conversion_playback(
     next_clicks,
     graph_click,
     scrub_time,
-    interval_ticks,
+    client_frame,
     file_clicks,
     speed_clicks,
     playback_data,
@@ -1934,21 +3836,22 @@ def update_conversion_playback(
     playback.setdefault("frame_index", 0)
     playback.setdefault("playing", False)
     playback.setdefault("speed", 1.0)
-    playback.setdefault("speed_accumulator", 0.0)
+    was_playing = bool(playback["playing"])
+    playback["client_frame_pending"] = False
+    pending_step = playback.pop("pending_step", 0)
 
     file_info, file_index = selected_conversion_file(result_data, playback)
     if not file_info:
-        playback.update({"file_index": 0, "frame_index": 0, "playing": False, "speed_accumulator": 0.0})
+        playback.update({"file_index": 0, "frame_index": 0, "playing": False})
         return playback
 
-    frame_count = len(file_info.get("output_rows", []))
+    frame_count = int(file_info.get("row_count", 0))
     if trigger == "conversion-result-store.data":
         playback.update({
             "file_index": 0,
             "frame_index": 0,
             "playing": False,
             "speed": float(playback.get("speed", 1.0) or 1.0),
-            "speed_accumulator": 0.0,
         })
         return playback
 
@@ -1959,43 +3862,47 @@ def update_conversion_playback(
                 playback["file_index"] = int(clicked_id.get("index", 0))
                 playback["frame_index"] = 0
                 playback["playing"] = False
-                playback["speed_accumulator"] = 0.0
                 return playback
             if clicked_id.get("type") == "conversion-speed-button":
                 playback["speed"] = float(clicked_id.get("speed", 1.0) or 1.0)
-                playback["speed_accumulator"] = 0.0
                 return playback
         except (ValueError, TypeError, json.JSONDecodeError):
             pass
         return playback
 
     file_info, file_index = selected_conversion_file(result_data, playback)
-    frame_count = len(file_info.get("output_rows", [])) if file_info else 0
+    frame_count = int(file_info.get("row_count", 0)) if file_info else 0
     current_frame = clamp_frame_index(file_info, playback.get("frame_index", 0)) if file_info else 0
     playback["frame_index"] = current_frame
 
     if trigger == "conversion-play.n_clicks":
         playback["playing"] = True
+    elif trigger in ("conversion-pause.n_clicks", "conversion-prev-frame.n_clicks", "conversion-next-frame.n_clicks") and was_playing:
+        # Only the browser knows which frame it is showing, so ask it and step
+        # from there once it answers.
+        playback["playing"] = False
+        playback["client_frame_pending"] = True
+        playback["frame_request"] = int(playback.get("frame_request", 0)) + 1
+        playback["pending_step"] = {
+            "conversion-prev-frame.n_clicks": -1,
+            "conversion-next-frame.n_clicks": 1,
+        }.get(trigger, 0)
     elif trigger == "conversion-pause.n_clicks":
         playback["playing"] = False
     elif trigger == "conversion-stop.n_clicks":
         playback["playing"] = False
         playback["frame_index"] = 0
-        playback["speed_accumulator"] = 0.0
     elif trigger == "conversion-prev-frame.n_clicks":
         playback["playing"] = False
         playback["frame_index"] = max(0, current_frame - 1)
-        playback["speed_accumulator"] = 0.0
     elif trigger == "conversion-next-frame.n_clicks":
         playback["playing"] = False
         playback["frame_index"] = min(max(frame_count - 1, 0), current_frame + 1)
-        playback["speed_accumulator"] = 0.0
     elif trigger == "conversion-strain-graph.clickData" and graph_click:
         points = graph_click.get("points") or []
         if points and file_info:
             playback["playing"] = False
             playback["frame_index"] = nearest_time_index(file_info, numeric_row_value(points[0], "x"))
-            playback["speed_accumulator"] = 0.0
     elif trigger == "conversion-scrub-time.value" and scrub_time not in (None, ""):
         try:
             selected_time = float(scrub_time)
@@ -2004,20 +3911,20 @@ def update_conversion_playback(
         if selected_time is not None:
             playback["playing"] = False
             playback["frame_index"] = nearest_time_index(file_info, selected_time)
-            playback["speed_accumulator"] = 0.0
-    elif trigger == "conversion-playback-interval.n_intervals":
-        if not playback.get("playing"):
+    elif trigger == "conversion-client-frame.value" and client_frame:
+        try:
+            reported = json.loads(client_frame)
+        except (TypeError, json.JSONDecodeError):
             return no_update
-        speed = float(playback.get("speed", 1.0) or 1.0)
-        current_time = row_time(file_info, current_frame)
-        final_time = row_time(file_info, frame_count - 1)
-        next_time = current_time + (PLAYBACK_INTERVAL_MS / 1000.0) * speed
-        if next_time >= final_time:
-            playback["frame_index"] = max(frame_count - 1, 0)
-            playback["playing"] = False
-            playback["speed_accumulator"] = 0.0
-        else:
-            playback["frame_index"] = nearest_time_index(file_info, next_time)
+        if int(reported.get("file_index", -1)) != file_index:
+            return no_update
+        request = reported.get("request")
+        if request is not None and request != playback.get("frame_request"):
+            return no_update
+        step = pending_step if request is not None else 0
+        playback["frame_index"] = clamp_frame_index(file_info, int(reported.get("frame_index", 0)) + step)
+        playback["playing"] = False
+        playback["client_frame_pending"] = False
 
     return playback
 
@@ -2031,11 +3938,13 @@ def update_conversion_playback(
     Output("conversion-anatomy-plot", "figure"),
     Output("conversion-strain-graph", "figure"),
     Output("conversion-value-table", "children"),
+    Output("conversion-figure-file", "data"),
     Input("conversion-result-store", "data"),
     Input("conversion-playback-store", "data"),
     State("conversion-anatomy-plot", "relayoutData"),
+    State("conversion-figure-file", "data"),
 )
-def update_conversion_visualization(result_data, playback_data, relayout_data):
+def update_conversion_visualization(result_data, playback_data, relayout_data, figure_file=None):
     files = (result_data or {}).get("files", [])
     if not files:
         return (
@@ -2056,6 +3965,7 @@ def update_conversion_visualization(result_data, playback_data, relayout_data):
             make_anatomy_figure(0, 0, 0, 0, 0, 0, ANTERIOR_ANATOMY_CAMERA),
             make_empty_conversion_figure("Process a CSV file to view strain traces."),
             "",
+            None,
         )
 
     file_info, file_index = selected_conversion_file(result_data, playback_data)
@@ -2083,6 +3993,42 @@ def update_conversion_visualization(result_data, playback_data, relayout_data):
         for option in PLAYBACK_SPEED_OPTIONS
     ]
 
+    shown_file = {
+        "upload_id": result_data.get("upload_id"),
+        "trial_id": file_info.get("trial_id"),
+        "file_index": file_index,
+    } if file_info.get("strains") else None
+    drawn_file = dict(figure_file or {})
+    drawn_frame = (drawn_file.pop("frame_index", None), drawn_file.pop("playing", None))
+    shown_frame = (frame_index, bool((playback_data or {}).get("playing")))
+    figure_record = {**shown_file, "frame_index": frame_index, "playing": shown_frame[1]} if shown_file else None
+    if shown_file and shown_file == drawn_file:
+        if shown_frame == drawn_frame:
+            # Only the speed or the frame handshake changed. While playing, the
+            # browser is ahead of the stored frame, so leave its playhead alone.
+            return (
+                file_buttons,
+                speed_buttons,
+                "Strain graph ready.",
+                "",
+                "",
+                no_update,
+                no_update,
+                no_update,
+                no_update,
+            )
+        return (
+            file_buttons,
+            speed_buttons,
+            "Strain graph ready.",
+            "",
+            "",
+            no_update,
+            conversion_playhead_patch(file_info, frame_index),
+            conversion_value_table_patch(file_info, frame_index),
+            figure_record,
+        )
+
     return (
         file_buttons,
         speed_buttons,
@@ -2092,6 +4038,7 @@ def update_conversion_visualization(result_data, playback_data, relayout_data):
         no_update,
         make_conversion_strain_figure(file_info, frame_index),
         make_conversion_value_table(file_info, frame_index),
+        figure_record,
     )
 
 
@@ -2485,7 +4432,7 @@ def update_surface_plots(
 
 
 @app.callback(
-    Output("anatomy-plot", "figure"),
+    Output("anatomy-pose-store", "data"),
     Output("fiber-plot", "figure"),
     Output("model-loading-message", "children"),
     [
@@ -2494,14 +4441,12 @@ def update_surface_plots(
         Input("proximal-slider", "value"),
         Input("surface-selection-store", "data"),
     ],
-    State("anatomy-camera-store", "data"),
 )
 def update_anatomy_and_fibers(
     flexion_ix,
     translation,
     proximal_ix,
     surface_selection,
-    stored_anatomy_camera,
 ):
     flexion = FLEXION_VALUES[flexion_ix]
     translation = normalized_translation(translation)
@@ -2511,16 +4456,14 @@ def update_anatomy_and_fibers(
     surface_selection = surface_selection or SURFACE_SELECTION_DEFAULT
     selected_adduction = surface_selection["adduction"]
     selected_rotation = surface_selection["rotation"]
-    anatomy_camera = stored_anatomy_camera if stored_anatomy_camera else ANTERIOR_ANATOMY_CAMERA
 
-    anatomy_fig = make_anatomy_figure(
+    anatomy_pose = make_anatomy_pose(
         flexion=flexion,
         adduction=selected_adduction,
         internal_rotation=selected_rotation,
         anterior_translation=anterior_translation,
         lateral_translation=lateral_translation,
         proximal_translation=proximal_translation,
-        camera=anatomy_camera,
     )
     fiber_fig = make_fiber_panel_figure(
         flexion=flexion,
@@ -2531,18 +4474,16 @@ def update_anatomy_and_fibers(
         proximal_translation=proximal_translation,
     )
 
-    return anatomy_fig, fiber_fig, ""
+    return anatomy_pose, fiber_fig, ""
 
 
-@app.callback(
-    Output("anatomy-camera-store", "data"),
-    Input("anatomy-plot", "relayoutData"),
-    State("anatomy-camera-store", "data"),
+app.clientside_callback(
+    ClientsideFunction(namespace="aclAnatomy", function_name="applyPose"),
+    Output("anatomy-plot", "figure"),
+    Input("anatomy-pose-store", "data"),
+    State("anatomy-plot", "figure"),
+    prevent_initial_call=True,
 )
-def store_anatomy_camera(anatomy_relayout_data, stored_anatomy_camera):
-    if anatomy_relayout_data and "scene.camera" in anatomy_relayout_data:
-        return anatomy_relayout_data["scene.camera"]
-    return stored_anatomy_camera
 
 
 if __name__ == "__main__":
@@ -459,11 +459,413 @@
         container.addEventListener("pointercancel", stopScrubbing);
     }
 
+    var playback = {
+        traceData: null,
+        times: null,
+        sorted: true,
+        strains: [],
+        fileIndex: null,
+        stride: 1,
+        rowCount: 0,
+        frame: 0,
+        time: 0,
+        speed: 1,
+        playing: false,
+        lastTimestamp: null,
+        request: null,
+        settledFrame: null,
+        answeredRequest: null,
+    };
+
+    var typedArrayTypes = {
+        f8: Float64Array,
+        f4: Float32Array,
+        i4: Int32Array,
+        u4: Uint32Array,
+        i2: Int16Array,
+        u2: Uint16Array,
+        i1: Int8Array,
+        u1: Uint8Array,
+    };
+
+    function decodeTypedArray(spec) {
+        var binary = window.atob(spec.bdata);
+        var bytes = new Uint8Array(binary.length);
+        for (var index = 0; index < binary.length; index += 1) {
+            bytes[index] = binary.charCodeAt(index);
+        }
+        return new typedArrayTypes[spec.dtype](bytes.buffer);
+    }
+
+    function isSorted(values) {
+        for (var index = 1; index < values.length; index += 1) {
+            if (!(values[index] >= values[index - 1])) {
+                return false;
+            }
+        }
+        return true;
+    }
+
+    function nearestFrame(times, sorted, value) {
+        var best = 0;
+        if (!sorted) {
+            for (var index = 1; index < times.length; index += 1) {
+                if (Math.abs(times[index] - value) < Math.abs(times[best] - value)) {
+                    best = index;
+                }
+            }
+            return best;
+        }
+
+        var low = 0;
+        var high = times.length - 1;
+        while (low < high) {
+            var middle = (low + high) >> 1;
+            if (times[middle] < value) {
+                low = middle + 1;
+            } else {
+                high = middle;
+            }
+        }
+        if (low > 0 && value - times[low - 1] <= times[low] - value) {
+            return low - 1;
+        }
+        return low;
+    }
+
+    function formatStrain(value) {
+        return (value >= 0 ? "+" : "") + value.toFixed(2);
+    }
+
+    function showPlaybackFrame(frame) {
+        if (frame === playback.frame) {
+            return;
+        }
+        playback.frame = frame;
+
+        var graph = document.querySelector("#conversion-strain-graph .js-plotly-plot");
+        var shapes = (graph && graph.layout && graph.layout.shapes) || [];
+        for (var index = 0; index < shapes.length; index += 1) {
+            if (shapes[index].name === "playhead" && window.Plotly) {
+                var update = {};
+                update["shapes[" + index + "].x0"] = playback.times[frame];
+                update["shapes[" + index + "].x1"] = playback.times[frame];
+                window.Plotly.relayout(graph, update);
+                break;
+            }
+        }
+
+        // The server-rendered table belongs to React, so playback writes into a
+        // copy of it in the readout element, which no callback ever renders.
+        var readout = document.getElementById("conversion-playback-readout");
+        if (!readout) {
+            return;
+        }
+        if (!readout.firstChild) {
+            var table = document.querySelector("#conversion-value-table table");
+            if (!table) {
+                return;
+            }
+            readout.appendChild(table.cloneNode(true));
+        }
+        var cells = readout.querySelectorAll("td");
+        for (var target = 0; target < cells.length && target < playback.strains.length; target += 1) {
+            cells[target].textContent = formatStrain(playback.strains[target][frame]);
+        }
+    }
+
+    function releasePlaybackReadout() {
+        var readout = document.getElementById("conversion-playback-readout");
+        var table = document.querySelector("#conversion-value-table table");
+        if (
+            !readout ||
+            !readout.firstChild ||
+            playback.settledFrame === null ||
+            (table && table.getAttribute("data-frame") !== String(playback.settledFrame))
+        ) {
+            return;
+        }
+        readout.textContent = "";
+        playback.settledFrame = null;
+    }
+
+    function setupPlaybackReadoutRelease() {
+        var container = document.getElementById("conversion-value-table");
+        if (!container || container.dataset.readoutObserved === "true") {
+            return;
+        }
+
+        container.dataset.readoutObserved = "true";
+        new MutationObserver(releasePlaybackReadout).observe(container, {
+            attributes: true,
+            attributeFilter: ["data-frame"],
+            childList: true,
+            subtree: true,
+        });
+    }
+
+    function playbackRow() {
+        return Math.min(playback.frame * playback.stride, playback.rowCount - 1);
+    }
+
+    function publishPlaybackFrame(fileIndex, frameIndex, request) {
+        var input = document.getElementById("conversion-client-frame");
+        if (input) {
+            setInputValue(input, JSON.stringify({
+                file_index: fileIndex,
+                frame_index: frameIndex,
+                request: request === undefined ? null : request,
+                reported_at: Date.now(),
+            }));
+        }
+    }
+
+    function stopPlaybackLoop() {
+        playback.playing = false;
+        if (playback.request !== null) {
+            window.cancelAnimationFrame(playback.request);
+            playback.request = null;
+        }
+    }
+
+    function advancePlayback(timestamp) {
+        playback.request = null;
+        if (!playback.playing) {
+            return;
+        }
+        if (playback.lastTimestamp !== null) {
+            playback.time += ((timestamp - playback.lastTimestamp) / 1000) * playback.speed;
+        }
+        playback.lastTimestamp = timestamp;
+
+        var lastFrame = playback.times.length - 1;
+        if (playback.time >= playback.times[lastFrame]) {
+            showPlaybackFrame(lastFrame);
+            stopPlaybackLoop();
+            publishPlaybackFrame(playback.fileIndex, playbackRow());
+            return;
+        }
+        showPlaybackFrame(nearestFrame(playback.times, playback.sorted, playback.time));
+        playback.request = window.requestAnimationFrame(advancePlayback);
+    }
+
+    function loadPlaybackTrace(traceData) {
+        if (traceData === playback.traceData) {
+            return;
+        }
+        stopPlaybackLoop();
+        playback.traceData = traceData;
+        playback.times = traceData ? decodeTypedArray(traceData.time) : null;
+        playback.sorted = playback.times ? isSorted(playback.times) : true;
+        playback.strains = traceData ? traceData.strains.map(decodeTypedArray) : [];
+        playback.fileIndex = traceData ? traceData.file_index : null;
+        playback.stride = traceData ? traceData.stride || 1 : 1;
+        playback.rowCount = traceData ? traceData.row_count : 0;
+    }
+
+    function syncPlayback(traceData, playbackData) {
+        var state = playbackData || {};
+        loadPlaybackTrace(traceData);
+
+        if (!state.playing || !playback.times || !playback.times.length || state.file_index !== playback.fileIndex) {
+            stopPlaybackLoop();
+            // Pause, Prev and Next during playback wait for the frame the browser
+            // is showing; answer each request once, even if the trace store fires.
+            if (state.client_frame_pending && state.frame_request !== playback.answeredRequest) {
+                playback.answeredRequest = state.frame_request;
+                // Before the trace arrives the browser has not moved, so the
+                // server's own frame is the one on screen.
+                var shown = playback.times && state.file_index === playback.fileIndex;
+                publishPlaybackFrame(
+                    state.file_index,
+                    shown ? playbackRow() : Number(state.frame_index) || 0,
+                    state.frame_request
+                );
+            } else if (!state.client_frame_pending) {
+                // Keep the live readout until the server table shows the frame
+                // playback settled on, so the old start frame never flashes.
+                playback.settledFrame = Number(state.frame_index) || 0;
+                releasePlaybackReadout();
+            }
+            return window.dash_clientside.no_update;
+        }
+
+        playback.speed = Number(state.speed) || 1;
+        if (!playback.playing) {
+            playback.frame = Math.min(
+                Math.max(Math.round((Number(state.frame_index) || 0) / playback.stride), 0),
+                playback.times.length - 1
+            );
+            playback.time = playback.times[playback.frame];
+            playback.lastTimestamp = null;
+            playback.settledFrame = null;
+            playback.playing = true;
+            playback.request = window.requestAnimationFrame(advancePlayback);
+        }
+        return window.dash_clientside.no_update;
+    }
+
+    function strainWindow(relayoutData) {
+        var data = relayoutData || {};
+        if (data["xaxis.autorange"]) {
+            return { range: null };
+        }
+        if (Array.isArray(data["xaxis.range"])) {
+            return { range: data["xaxis.range"].slice(0, 2) };
+        }
+        if (data["xaxis.range[0]"] !== undefined && data["xaxis.range[1]"] !== undefined) {
+            return { range: [data["xaxis.range[0]"], data["xaxis.range[1]"]] };
+        }
+        return window.dash_clientside.no_update;
+    }
+
+    var anatomyReference = null;
+
+    function numericArray(values) {
+        return values && values.bdata !== undefined ? decodeTypedArray(values) : values;
+    }
+
+    function transformedMesh(reference, transform) {
+        var rotation = transform.rotation;
+        var offset = transform.offset;
+        var count = reference.x.length;
+        var mesh = {
+            x: new Float64Array(count),
+            y: new Float64Array(count),
+            z: new Float64Array(count),
+            cmin: Infinity,
+            cmax: -Infinity,
+        };
+
+        for (var index = 0; index < count; index += 1) {
+            var x = reference.x[index];
+            var y = reference.y[index];
+            var z = reference.z[index];
+            mesh.x[index] = rotation[0][0] * x + rotation[0][1] * y + rotation[0][2] * z + offset[0];
+            mesh.y[index] = rotation[1][0] * x + rotation[1][1] * y + rotation[1][2] * z + offset[1];
+            mesh.z[index] = rotation[2][0] * x + rotation[2][1] * y + rotation[2][2] * z + offset[2];
+            mesh.cmin = Math.min(mesh.cmin, mesh.z[index]);
+            mesh.cmax = Math.max(mesh.cmax, mesh.z[index]);
+        }
+        mesh.intensity = mesh.z;
+        return mesh;
+    }
+
+    function applyAnatomyPose(pose, figure) {
+        if (!pose || !figure || !figure.data) {
+            return window.dash_clientside.no_update;
+        }
+        if (!anatomyReference) {
+            anatomyReference = pose.meshes.map(function (transform, index) {
+                var trace = figure.data[index];
+                return {
+                    x: Float64Array.from(numericArray(trace.x)),
+                    y: Float64Array.from(numericArray(trace.y)),
+                    z: Float64Array.from(numericArray(trace.z)),
+                };
+            });
+        }
+
+        var data = figure.data.slice();
+        pose.meshes.forEach(function (transform, index) {
+            data[index] = Object.assign({}, data[index], transformedMesh(anatomyReference[index], transform));
+        });
+        pose.fibers.forEach(function (points, index) {
+            var traceIndex = pose.meshes.length + index;
+            data[traceIndex] = Object.assign({}, data[traceIndex], { x: points[0], y: points[1], z: points[2] });
+        });
+        return Object.assign({}, figure, { data: data });
+    }
+
+    window.dash_clientside = Object.assign({}, window.dash_clientside, {
+        aclPlayback: { syncPlayback: syncPlayback, strainWindow: strainWindow },
+        aclAnatomy: { applyPose: applyAnatomyPose },
+    });
+
+    function trialUploadUrl() {
+        var configElement = document.getElementById("_dash-config");
+        var prefix = "/";
+        if (configElement) {
+            try {
+                prefix = JSON.parse(configElement.textContent).requests_pathname_prefix || "/";
+            } catch (error) {
+                prefix = "/";
+            }
+        }
+        return prefix + "upload/trials";
+    }
+
+    function uploadTrialFile(file) {
+        return fetch(trialUploadUrl() + "?name=" + encodeURIComponent(file.name), {
+            method: "POST",
+            body: file,
+            headers: { "Content-Type": "application/octet-stream" },
+        }).then(function (response) {
+            if (!response.ok) {
+                return { files: [], errors: [file.name + ": Upload failed (" + response.status + ")."] };
+            }
+            return response.json();
+        }).catch(function () {
+            return { files: [], errors: [file.name + ": Upload failed."] };
+        });
+    }
+
+    function uploadTrialFiles(files) {
+        var input = document.getElementById("uploaded-trial-handles");
+        // upload-summary is rendered by a callback, so the in-flight message
+        // goes into an element no callback touches.
+        var status = document.getElementById("upload-progress");
+        if (!input || !files || !files.length) {
+            return;
+        }
+
+        if (status) {
+            status.textContent = "Uploading " + files.length + (files.length === 1 ? " file..." : " files...");
+        }
+        Promise.all(files.map(uploadTrialFile)).then(function (results) {
+            if (status) {
+                status.textContent = "";
+            }
+            setInputValue(input, JSON.stringify({
+                files: results.reduce(function (all, result) { return all.concat(result.files || []); }, []),
+                errors: results.reduce(function (all, result) { return all.concat(result.errors || []); }, []),
+                uploaded_at: Date.now(),
+            }));
+        });
+    }
+
+    function setupDirectTrialUpload() {
+        if (!window.fetch) {
+            return;
+        }
+
+        document.addEventListener("drop", function (event) {
+            if (!event.target.closest || !event.target.closest("#kinematic-upload")) {
+                return;
+            }
+            event.preventDefault();
+            event.stopPropagation();
+            uploadTrialFiles(Array.prototype.slice.call((event.dataTransfer && event.dataTransfer.files) || []));
+        }, true);
+
+        document.addEventListener("change", function (event) {
+            var target = event.target;
+            if (target.type !== "file" || !target.closest || !target.closest("#kinematic-upload")) {
+                return;
+            }
+            event.stopPropagation();
+            uploadTrialFiles(Array.prototype.slice.call(target.files || []));
+            target.value = "";
+        }, true);
+    }
+
     function setupInteractions() {
         setupKinematicPads();
         setupPlotPinchZooms();
+        setupPlaybackReadoutRelease();
     }
 
+    setupDirectTrialUpload();
     document.addEventListener("DOMContentLoaded", setupInteractions);
     new MutationObserver(setupInteractions).observe(document.body, {
         childList: true,
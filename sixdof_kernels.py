@@ -0,0 +1,164 @@
+# Generated by tools/build_sixdof_kernels.py from SIXDOF_EQUATIONS in app.py.
+# Do not edit by hand; rerun the tool after changing an equation.
+
+try:
+    import numba
+except ImportError:
+    numba = None
+
+prange = numba.prange if numba is not None else range
+
+SIXDOF_EQUATIONS_HASH = "7e1053c806a6ee1d4d5ddd899edcda51054de96ac01947c3a2874697597d9bf7"
+SIXDOF_TARGETS = ('ACLam', 'ACLpl', 'ACLam1', 'ACLam2', 'ACLam3', 'ACLam4', 'ACLam5', 'ACLam6', 'ACLpl1', 'ACLpl2', 'ACLpl3', 'ACLpl4', 'ACLpl5', 'ACLpl6')
+
+
+def strain_ACLam(x0, x1, x2, x3, x4, x5):
+    return (0.33229794591841 * (x0 - 34.607643) ** 2 - 3101.2253) * (-17.1095808141759 * x3 ** 2 + x4 - 0.0033823408) + -45.693962 * ((x0 - 35.403862) * x3 + (x1 + 1 / 1.5905658 * x2 + 15.755187) * (x5 - 0.003627654) + x4 + x4 - 967.63552511749 * x5 ** 2 + 0.16718635) - 5.085127
+
+
+def strain_ACLpl(x0, x1, x2, x3, x4, x5):
+    return (x0 + (--0.053760957 * (x1 - x2) + 0.9697227) ** 2 - 938.8581 * x3 - 33.991817) * (-68.95864 * x3 - -12.747882 * x4 - 0.13223389) + (0.10550165 * (x1 + x1 + x2) - 318.99036 * x5) * (-318.99 * x5 + 2.175888) - 3694.536 * x4 - 2.680973
+
+
+def strain_ACLam1(x0, x1, x2, x3, x4, x5):
+    return -(x0 * (x4 + x4 + x5 ** 3 - 0.03951113) + x5 + 2.144635) ** 2 + -42.29675 * ((x0 - 34.726818) * x3 + (x1 + 0.6534827 * x2) * (x5 - 0.0018377672) + 1 / 0.054127015 * (-56.865127564609 * x3 ** 2 + x5) + 67.86892 * x4) + x4 + 0.9728942
+
+
+def strain_ACLam2(x0, x1, x2, x3, x4, x5):
+    return -51.8912734601096 * (x0 - 35.750355) * (x3 + 0.00079133944) + 0.000809632203023568 * x0 ** 3 * (x4 - 0.0071268436) + (1.5967277 * x1 + x2) * (43.93074 * x5 - 0.37357137) ** 2 + 35023.8548934404 * x3 ** 2 - 3287.5598 * x4 - 795.80994 * x5 + 5.88824
+
+
+def strain_ACLam3(x0, x1, x2, x3, x4, x5):
+    return -0.00130345239889526 * x0 ** 2 - 44.8841656383704 * x0 * x3 + 0.11475795 * x1 - 25.546790545752 * (1.67836712333917 * x1 + x2) * x5 + 0.0711546283380525 * x2 + (222.61456 * x3) ** 2 + 1441.57801008659 * x3 - 3196.83688610925 * x4 - 1006.61810122992 * x5 + 4.6786187855795
+
+
+def strain_ACLam4(x0, x1, x2, x3, x4, x5):
+    return -((2 * x0 - 2129.0378 * x3 - 75.903366) * x3 + 1.3767647 * (-(2 * x0 * x5 + 2.3181846) ** 3 + x1 + x2) * (x5 - 0.0036609492) + 114.89593 * x4 + 36.25568 * x5) * (((x0 - 60.908016) * x3 + 1.9399457) ** 3 + 16.184116)
+
+
+def strain_ACLam5(x0, x1, x2, x3, x4, x5):
+    return -1.03666715573168 * (x0 - 963.28015 * x3 - 35.34071) * ((x0 - 44.007164) * (-0.3205996 * x4 + 0.0015204152) + 44.007164 * x3 - 0.01188406) + 1.03666715573168 * (x1 + x2) * (-31.343166 * x5 + 0.08905915) - 2963.83160557029 * x4 - 681.831617923627 * x5 - 0.445927579458896
+
+
+def strain_ACLam6(x0, x1, x2, x3, x4, x5):
+    return -0.011638595 * (0.38027668 * x0 - 10.5686627669055) ** 2 - 46.1567788845661 * (x0 - 37.177414) * x3 - (x1 + 0.76724744 * x2 + 15.939155) * (37.177414 * x5 - 0.16253783) + (214.66698 * x3) ** 2 - 2834.4802 * x4 - 3.08217248
+
+
+def strain_ACLpl1(x0, x1, x2, x3, x4, x5):
+    return -(x0 - 34.809135) * (63.478844 * x3 + 0.2761004) + (x0 * x4 - 276.20282 * x3) ** 2 + 0.44146368 * x1 - 29.836025 * (2 * x1 + x2 - 2301.61748931002 * x5 + 43.210583) * x5 + 0.208517245543903 * x2 - 3698.3384 * x4 + 5.7335176
+
+
+def strain_ACLpl2(x0, x1, x2, x3, x4, x5):
+    return -(x0 - 33.111416) * ((x0 * x4 + 2.1356351) * (37.600742 * x3 - 0.3601098) + 1.0103464) - 34.803547 * (2 * x1 + (x1 + 35.69067) * x2 * x3 + x2 + 20.343311) * (x5 - 0.008030077) + (285.15594 * x3) ** 2 - 4193.074 * x4 - 2.2094288
+
+
+def strain_ACLpl3(x0, x1, x2, x3, x4, x5):
+    return (x0 - 34.20155) * (-61.011536 * x3 - 0.06456746) + (-x0 * (x0 - 52.733982) * (-20.559412 * x3 + 0.36518446) + 3522.5583) * (16.821009 * (x3 * x3 + x5 ** 2) - x4) + (1.6168772 * x1 + x2 + 16.789593) * (x3 + 34.208508 * (-x5 + 0.0058085155))
+
+
+def strain_ACLpl4(x0, x1, x2, x3, x4, x5):
+    return -(73.85144 * (x0 - 0.15549265 * x2 - 945.6684 * x3 - 33.473907) * x3 + 73.85144 * (0.185134417741925 * x0 ** 2 * (x3 - 0.006981589) + 49.533405) * x4 + 73.85144 * (x1 + 0.5969702 * x2) * (x5 - 0.00570674) + 147.70288 * x5 + 2.65241843)
+
+
+def strain_ACLpl5(x0, x1, x2, x3, x4, x5):
+    return ((x0 - 32.67652) * (x3 + 0.0013623238) + 1 / 0.019699348 * x4) * (x0 ** 3 * x4 ** 2 - 72.69223) + (((x0 + 1 / -1.9447919 * x2) * x3 - 1.944792) ** (-1) * x2 - x1 - 12.863291) * (x3 + 1 / 0.015374125 * x5 - 0.44170365) + 74481.45 * x3 ** 2 - -0.8452492
+
+
+def strain_ACLpl6(x0, x1, x2, x3, x4, x5):
+    return 71.5004 * ((x0 + 1 / 0.115981385 * (x0 * x4 - 0.016667467 * x2) - -15.327085) * (-x3 - 0.002462248) + 49.497734 * (x3 - x4)) + x0 * x4 + (x1 + x1 + x2 - -13.092675) * (-1 / 0.02717516 * x5 + 0.23758522) + 72743.9587903744 * x3 ** 2 + 7.5001183
+
+
+def sixdof_fused_kernel(x0, x1, x2, x3, x4, x5):
+    t0 = x3 ** 2
+    t1 = x5 ** 2
+    t2 = x1 + x1
+    t3 = t2 + x2
+    t4 = x0 ** 3
+    t5 = x0 ** 2
+    t6 = 2 * x0
+    t7 = x0 * x4
+    t8 = 2 * x1
+    ACLam = (0.33229794591841 * (x0 - 34.607643) ** 2 - 3101.2253) * (-17.1095808141759 * t0 + x4 - 0.0033823408) + -45.693962 * ((x0 - 35.403862) * x3 + (x1 + 1 / 1.5905658 * x2 + 15.755187) * (x5 - 0.003627654) + x4 + x4 - 967.63552511749 * t1 + 0.16718635) - 5.085127
+    ACLpl = (x0 + (--0.053760957 * (x1 - x2) + 0.9697227) ** 2 - 938.8581 * x3 - 33.991817) * (-68.95864 * x3 - -12.747882 * x4 - 0.13223389) + (0.10550165 * t3 - 318.99036 * x5) * (-318.99 * x5 + 2.175888) - 3694.536 * x4 - 2.680973
+    ACLam1 = -(x0 * (x4 + x4 + x5 ** 3 - 0.03951113) + x5 + 2.144635) ** 2 + -42.29675 * ((x0 - 34.726818) * x3 + (x1 + 0.6534827 * x2) * (x5 - 0.0018377672) + 1 / 0.054127015 * (-56.865127564609 * t0 + x5) + 67.86892 * x4) + x4 + 0.9728942
+    ACLam2 = -51.8912734601096 * (x0 - 35.750355) * (x3 + 0.00079133944) + 0.000809632203023568 * t4 * (x4 - 0.0071268436) + (1.5967277 * x1 + x2) * (43.93074 * x5 - 0.37357137) ** 2 + 35023.8548934404 * t0 - 3287.5598 * x4 - 795.80994 * x5 + 5.88824
+    ACLam3 = -0.00130345239889526 * t5 - 44.8841656383704 * x0 * x3 + 0.11475795 * x1 - 25.546790545752 * (1.67836712333917 * x1 + x2) * x5 + 0.0711546283380525 * x2 + (222.61456 * x3) ** 2 + 1441.57801008659 * x3 - 3196.83688610925 * x4 - 1006.61810122992 * x5 + 4.6786187855795
+    ACLam4 = -((t6 - 2129.0378 * x3 - 75.903366) * x3 + 1.3767647 * (-(t6 * x5 + 2.3181846) ** 3 + x1 + x2) * (x5 - 0.0036609492) + 114.89593 * x4 + 36.25568 * x5) * (((x0 - 60.908016) * x3 + 1.9399457) ** 3 + 16.184116)
+    ACLam5 = -1.03666715573168 * (x0 - 963.28015 * x3 - 35.34071) * ((x0 - 44.007164) * (-0.3205996 * x4 + 0.0015204152) + 44.007164 * x3 - 0.01188406) + 1.03666715573168 * (x1 + x2) * (-31.343166 * x5 + 0.08905915) - 2963.83160557029 * x4 - 681.831617923627 * x5 - 0.445927579458896
+    ACLam6 = -0.011638595 * (0.38027668 * x0 - 10.5686627669055) ** 2 - 46.1567788845661 * (x0 - 37.177414) * x3 - (x1 + 0.76724744 * x2 + 15.939155) * (37.177414 * x5 - 0.16253783) + (214.66698 * x3) ** 2 - 2834.4802 * x4 - 3.08217248
+    ACLpl1 = -(x0 - 34.809135) * (63.478844 * x3 + 0.2761004) + (t7 - 276.20282 * x3) ** 2 + 0.44146368 * x1 - 29.836025 * (t8 + x2 - 2301.61748931002 * x5 + 43.210583) * x5 + 0.208517245543903 * x2 - 3698.3384 * x4 + 5.7335176
+    ACLpl2 = -(x0 - 33.111416) * ((t7 + 2.1356351) * (37.600742 * x3 - 0.3601098) + 1.0103464) - 34.803547 * (t8 + (x1 + 35.69067) * x2 * x3 + x2 + 20.343311) * (x5 - 0.008030077) + (285.15594 * x3) ** 2 - 4193.074 * x4 - 2.2094288
+    ACLpl3 = (x0 - 34.20155) * (-61.011536 * x3 - 0.06456746) + (-x0 * (x0 - 52.733982) * (-20.559412 * x3 + 0.36518446) + 3522.5583) * (16.821009 * (x3 * x3 + t1) - x4) + (1.6168772 * x1 + x2 + 16.789593) * (x3 + 34.208508 * (-x5 + 0.0058085155))
+    ACLpl4 = -(73.85144 * (x0 - 0.15549265 * x2 - 945.6684 * x3 - 33.473907) * x3 + 73.85144 * (0.185134417741925 * t5 * (x3 - 0.006981589) + 49.533405) * x4 + 73.85144 * (x1 + 0.5969702 * x2) * (x5 - 0.00570674) + 147.70288 * x5 + 2.65241843)
+    ACLpl5 = ((x0 - 32.67652) * (x3 + 0.0013623238) + 1 / 0.019699348 * x4) * (t4 * x4 ** 2 - 72.69223) + (((x0 + 1 / -1.9447919 * x2) * x3 - 1.944792) ** (-1) * x2 - x1 - 12.863291) * (x3 + 1 / 0.015374125 * x5 - 0.44170365) + 74481.45 * t0 - -0.8452492
+    ACLpl6 = 71.5004 * ((x0 + 1 / 0.115981385 * (t7 - 0.016667467 * x2) - -15.327085) * (-x3 - 0.002462248) + 49.497734 * (x3 - x4)) + t7 + (t3 - -13.092675) * (-1 / 0.02717516 * x5 + 0.23758522) + 72743.9587903744 * t0 + 7.5001183
+    return (ACLam, ACLpl, ACLam1, ACLam2, ACLam3, ACLam4, ACLam5, ACLam6, ACLpl1, ACLpl2, ACLpl3, ACLpl4, ACLpl5, ACLpl6)
+
+
+def sixdof_parallel_kernel(x0_values, x1_values, x2_values, x3_values, x4_values, x5_values, out):
+    for index in prange(x0_values.shape[0]):
+        x0 = x0_values[index]
+        x1 = x1_values[index]
+        x2 = x2_values[index]
+        x3 = x3_values[index]
+        x4 = x4_values[index]
+        x5 = x5_values[index]
+        t0 = x3 ** 2
+        t1 = x5 ** 2
+        t2 = x1 + x1
+        t3 = t2 + x2
+        t4 = x0 ** 3
+        t5 = x0 ** 2
+        t6 = 2 * x0
+        t7 = x0 * x4
+        t8 = 2 * x1
+        ACLam = (0.33229794591841 * (x0 - 34.607643) ** 2 - 3101.2253) * (-17.1095808141759 * t0 + x4 - 0.0033823408) + -45.693962 * ((x0 - 35.403862) * x3 + (x1 + 1 / 1.5905658 * x2 + 15.755187) * (x5 - 0.003627654) + x4 + x4 - 967.63552511749 * t1 + 0.16718635) - 5.085127
+        ACLpl = (x0 + (--0.053760957 * (x1 - x2) + 0.9697227) ** 2 - 938.8581 * x3 - 33.991817) * (-68.95864 * x3 - -12.747882 * x4 - 0.13223389) + (0.10550165 * t3 - 318.99036 * x5) * (-318.99 * x5 + 2.175888) - 3694.536 * x4 - 2.680973
+        ACLam1 = -(x0 * (x4 + x4 + x5 ** 3 - 0.03951113) + x5 + 2.144635) ** 2 + -42.29675 * ((x0 - 34.726818) * x3 + (x1 + 0.6534827 * x2) * (x5 - 0.0018377672) + 1 / 0.054127015 * (-56.865127564609 * t0 + x5) + 67.86892 * x4) + x4 + 0.9728942
+        ACLam2 = -51.8912734601096 * (x0 - 35.750355) * (x3 + 0.00079133944) + 0.000809632203023568 * t4 * (x4 - 0.0071268436) + (1.5967277 * x1 + x2) * (43.93074 * x5 - 0.37357137) ** 2 + 35023.8548934404 * t0 - 3287.5598 * x4 - 795.80994 * x5 + 5.88824
+        ACLam3 = -0.00130345239889526 * t5 - 44.8841656383704 * x0 * x3 + 0.11475795 * x1 - 25.546790545752 * (1.67836712333917 * x1 + x2) * x5 + 0.0711546283380525 * x2 + (222.61456 * x3) ** 2 + 1441.57801008659 * x3 - 3196.83688610925 * x4 - 1006.61810122992 * x5 + 4.6786187855795
+        ACLam4 = -((t6 - 2129.0378 * x3 - 75.903366) * x3 + 1.3767647 * (-(t6 * x5 + 2.3181846) ** 3 + x1 + x2) * (x5 - 0.0036609492) + 114.89593 * x4 + 36.25568 * x5) * (((x0 - 60.908016) * x3 + 1.9399457) ** 3 + 16.184116)
+        ACLam5 = -1.03666715573168 * (x0 - 963.28015 * x3 - 35.34071) * ((x0 - 44.007164) * (-0.3205996 * x4 + 0.0015204152) + 44.007164 * x3 - 0.01188406) + 1.03666715573168 * (x1 + x2) * (-31.343166 * x5 + 0.08905915) - 2963.83160557029 * x4 - 681.831617923627 * x5 - 0.445927579458896
+        ACLam6 = -0.011638595 * (0.38027668 * x0 - 10.5686627669055) ** 2 - 46.1567788845661 * (x0 - 37.177414) * x3 - (x1 + 0.76724744 * x2 + 15.939155) * (37.177414 * x5 - 0.16253783) + (214.66698 * x3) ** 2 - 2834.4802 * x4 - 3.08217248
+        ACLpl1 = -(x0 - 34.809135) * (63.478844 * x3 + 0.2761004) + (t7 - 276.20282 * x3) ** 2 + 0.44146368 * x1 - 29.836025 * (t8 + x2 - 2301.61748931002 * x5 + 43.210583) * x5 + 0.208517245543903 * x2 - 3698.3384 * x4 + 5.7335176
+        ACLpl2 = -(x0 - 33.111416) * ((t7 + 2.1356351) * (37.600742 * x3 - 0.3601098) + 1.0103464) - 34.803547 * (t8 + (x1 + 35.69067) * x2 * x3 + x2 + 20.343311) * (x5 - 0.008030077) + (285.15594 * x3) ** 2 - 4193.074 * x4 - 2.2094288
+        ACLpl3 = (x0 - 34.20155) * (-61.011536 * x3 - 0.06456746) + (-x0 * (x0 - 52.733982) * (-20.559412 * x3 + 0.36518446) + 3522.5583) * (16.821009 * (x3 * x3 + t1) - x4) + (1.6168772 * x1 + x2 + 16.789593) * (x3 + 34.208508 * (-x5 + 0.0058085155))
+        ACLpl4 = -(73.85144 * (x0 - 0.15549265 * x2 - 945.6684 * x3 - 33.473907) * x3 + 73.85144 * (0.185134417741925 * t5 * (x3 - 0.006981589) + 49.533405) * x4 + 73.85144 * (x1 + 0.5969702 * x2) * (x5 - 0.00570674) + 147.70288 * x5 + 2.65241843)
+        ACLpl5 = ((x0 - 32.67652) * (x3 + 0.0013623238) + 1 / 0.019699348 * x4) * (t4 * x4 ** 2 - 72.69223) + (((x0 + 1 / -1.9447919 * x2) * x3 - 1.944792) ** (-1) * x2 - x1 - 12.863291) * (x3 + 1 / 0.015374125 * x5 - 0.44170365) + 74481.45 * t0 - -0.8452492
+        ACLpl6 = 71.5004 * ((x0 + 1 / 0.115981385 * (t7 - 0.016667467 * x2) - -15.327085) * (-x3 - 0.002462248) + 49.497734 * (x3 - x4)) + t7 + (t3 - -13.092675) * (-1 / 0.02717516 * x5 + 0.23758522) + 72743.9587903744 * t0 + 7.5001183
+        out[0, index] = ACLam
+        out[1, index] = ACLpl
+        out[2, index] = ACLam1
+        out[3, index] = ACLam2
+        out[4, index] = ACLam3
+        out[5, index] = ACLam4
+        out[6, index] = ACLam5
+        out[7, index] = ACLam6
+        out[8, index] = ACLpl1
+        out[9, index] = ACLpl2
+        out[10, index] = ACLpl3
+        out[11, index] = ACLpl4
+        out[12, index] = ACLpl5
+        out[13, index] = ACLpl6
+
+
+if numba is not None:
+    sixdof_parallel_kernel = numba.njit(parallel=True, cache=True)(sixdof_parallel_kernel)
+
+
+SIXDOF_TARGET_KERNELS = {
+    "ACLam": strain_ACLam,
+    "ACLpl": strain_ACLpl,
+    "ACLam1": strain_ACLam1,
+    "ACLam2": strain_ACLam2,
+    "ACLam3": strain_ACLam3,
+    "ACLam4": strain_ACLam4,
+    "ACLam5": strain_ACLam5,
+    "ACLam6": strain_ACLam6,
+    "ACLpl1": strain_ACLpl1,
+    "ACLpl2": strain_ACLpl2,
+    "ACLpl3": strain_ACLpl3,
+    "ACLpl4": strain_ACLpl4,
+    "ACLpl5": strain_ACLpl5,
+    "ACLpl6": strain_ACLpl6,
+}
@@ -0,0 +1,22 @@
+import sys
+from pathlib import Path
+
+
+APP_ROOT = Path(__file__).resolve().parents[1]
+OUTPUT_PATH = APP_ROOT / "sixdof_kernels.py"
+
+sys.path.insert(0, str(APP_ROOT))
+
+from app import CONVERSION_OUTPUT_COLUMNS, SIXDOF_EQUATIONS, sixdof_kernel_module_source
+
+
+def main():
+    OUTPUT_PATH.write_text(
+        sixdof_kernel_module_source(SIXDOF_EQUATIONS, CONVERSION_OUTPUT_COLUMNS),
+        encoding="utf-8",
+    )
+    print(f"Wrote {OUTPUT_PATH}")
+
+
+if __name__ == "__main__":
+    main()